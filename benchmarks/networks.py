@@ -0,0 +1,78 @@
+"""Synthetic AlchemicalNetworks for benchmarking strategies.
+
+Each topology is built as a networkx DiGraph with integer nodes and
+converted with the same helper used by the test networks. Networks
+are cached per process since building the largest ones dominates the
+setup time of a benchmark.
+"""
+
+import functools
+import math
+from random import Random
+
+import networkx as nx
+from gufe.tests.test_protocol import DummyProtocolResult
+
+from stratocaster.tests.networks import digraph_to_alchemical_network
+
+SIZES = [10**2, 10**3, 10**4, 10**5]
+TOPOLOGIES = ["star", "radial", "lattice", "components"]
+
+
+def star_digraph(n_nodes: int) -> nx.DiGraph:
+    """A single central node connected to every other node."""
+    return nx.DiGraph(list(nx.star_graph(n_nodes - 1).edges()))
+
+
+def radial_digraph(n_nodes: int, branch: int = 3) -> nx.DiGraph:
+    """A tree in which every node fans out to ``branch`` children."""
+    return nx.DiGraph(list(nx.full_rary_tree(branch, n_nodes).edges()))
+
+
+def lattice_digraph(n_nodes: int) -> nx.DiGraph:
+    """A square two-dimensional grid."""
+    side = math.isqrt(n_nodes)
+    grid = nx.convert_node_labels_to_integers(nx.grid_2d_graph(side, side))
+    return nx.DiGraph(list(grid.edges()))
+
+
+def components_digraph(n_nodes: int, component_size: int = 10) -> nx.DiGraph:
+    """Many disconnected star maps of ``component_size`` nodes."""
+    graph = nx.DiGraph()
+    for center in range(0, n_nodes, component_size):
+        graph.add_edges_from(
+            (center, leaf)
+            for leaf in range(center + 1, min(center + component_size, n_nodes))
+        )
+    return graph
+
+
+DIGRAPH_BUILDERS = {
+    "star": star_digraph,
+    "radial": radial_digraph,
+    "lattice": lattice_digraph,
+    "components": components_digraph,
+}
+
+
+@functools.cache
+def synthetic_network(topology: str, n_nodes: int):
+    return digraph_to_alchemical_network(DIGRAPH_BUILDERS[topology](n_nodes))
+
+
+@functools.cache
+def synthetic_protocol_results(topology: str, n_nodes: int, fraction: float = 0.5):
+    """ProtocolResults for a random ``fraction`` of the Transformations."""
+    rng = Random(n_nodes)
+    transformations = sorted(
+        synthetic_network(topology, n_nodes).edges, key=lambda t: t.key
+    )
+    return {
+        transformation.key: DummyProtocolResult(
+            n_protocol_dag_results=rng.randint(1, 2),
+            info=f"key: {transformation.key}",
+        )
+        for transformation in rng.sample(
+            transformations, int(fraction * len(transformations))
+        )
+    }
@@ -0,0 +1,59 @@
+from gufe.tokenization import GufeKey
+
+from stratocaster.base import StrategyResult
+
+from .networks import SIZES
+
+
+def synthetic_result(n_transformations: int, offset: int = 0) -> StrategyResult:
+    """A StrategyResult where every tenth weight is None."""
+    return StrategyResult(
+        {
+            GufeKey(f"Transformation-{i:032x}"): None if i % 10 == 0 else 1.0 / (i + 1)
+            for i in range(offset, offset + n_transformations)
+        }
+    )
+
+
+class StrategyResultResolve:
+    """Time and peak memory of ``StrategyResult.resolve``."""
+
+    params = SIZES
+    param_names = ["n_transformations"]
+
+    def setup(self, n_transformations):
+        self.result = synthetic_result(n_transformations)
+
+    def time_resolve(self, n_transformations):
+        self.result.resolve()
+
+    def peakmem_resolve(self, n_transformations):
+        self.result.resolve()
+
+
+class StrategyResultCombine:
+    """Time and peak memory of combining StrategyResults, both as a
+    pair with ``|`` and as the many single-component results produced
+    by proposing a network of disconnected subgraphs."""
+
+    params = (SIZES, [2, 1000])
+    param_names = ["n_transformations", "n_results"]
+
+    def setup(self, n_transformations, n_results):
+        size = max(n_transformations // n_results, 1)
+        self.results = [
+            synthetic_result(size, offset=i * size) for i in range(n_results)
+        ]
+
+    def time_or(self, n_transformations, n_results):
+        acc = StrategyResult({})
+        for result in self.results:
+            acc |= result
+
+    def peakmem_or(self, n_transformations, n_results):
+        acc = StrategyResult({})
+        for result in self.results:
+            acc |= result
+
+    def time_merge(self, n_transformations, n_results):
+        StrategyResult.merge(self.results)
@@ -0,0 +1,56 @@
+from stratocaster.strategies import ConnectivityStrategy, RadialGrowthStrategy
+
+from .networks import SIZES, TOPOLOGIES, synthetic_network, synthetic_protocol_results
+
+STRATEGIES = {
+    "ConnectivityStrategy": ConnectivityStrategy,
+    "RadialGrowthStrategy": RadialGrowthStrategy,
+}
+
+
+class StrategyPropose:
+    """Time and peak memory of ``Strategy.propose``."""
+
+    params = (list(STRATEGIES), TOPOLOGIES, SIZES)
+    param_names = ["strategy", "topology", "n_nodes"]
+    timeout = 600
+
+    def setup(self, strategy, topology, n_nodes):
+        strategy_class = STRATEGIES[strategy]
+        self.strategy = strategy_class(strategy_class.default_settings())
+        self.network = synthetic_network(topology, n_nodes)
+        self.protocol_results = synthetic_protocol_results(topology, n_nodes)
+
+    def time_propose(self, strategy, topology, n_nodes):
+        self.strategy.propose(self.network, self.protocol_results)
+
+    def peakmem_propose(self, strategy, topology, n_nodes):
+        self.strategy.propose(self.network, self.protocol_results)
+
+
+class UncertaintyUpdate:
+    """Time of an ``UncertaintyStrategy`` proposal after a few new
+    results, which updates the cached factorization rather than
+    refactorizing."""
+
+    params = (TOPOLOGIES, SIZES[:3])
+    param_names = ["topology", "n_nodes"]
+    timeout = 600
+
+    def setup(self, topology, n_nodes):
+        from stratocaster.strategies import UncertaintyStrategy
+        from stratocaster.strategies.uncertainty import UncertaintyStrategySettings
+
+        self.strategy = UncertaintyStrategy(
+            UncertaintyStrategySettings(max_runs=3, max_update_rank=32)
+        )
+        self.network = synthetic_network(topology, n_nodes)
+        self.protocol_results = synthetic_protocol_results(topology, n_nodes)
+        self.strategy.propose(self.network, self.protocol_results)
+
+        self.updated_results = dict(self.protocol_results)
+        for transformation in sorted(self.network.edges, key=lambda t: t.key)[:4]:
+            self.updated_results[transformation.key] = 3
+
+    def time_propose_update(self, topology, n_nodes):
+        self.strategy.propose(self.network, self.updated_results)
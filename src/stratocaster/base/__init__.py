@@ -1,2 +1,15 @@
+from .aio import AsyncProposer
+from .arrays import ArrayStrategyResult, KeyTable
+from .cache import CacheStatistics, KeyedCache
+from .counts import ResultSummary, result_count, result_counts
+from .memo import ProposalCache
 from .models import StrategySettings
-from .strategy import Strategy, StrategyResult
+from .strategy import (
+    IncrementalProposal,
+    RecomputedProposal,
+    Strategy,
+    StrategyResult,
+    StrategyResultDelta,
+    VersionedProposal,
+)
+from .tracing import ProposeRecord, ProposeTracer
@@ -0,0 +1,128 @@
+"""Asyncio-native proposals driven by streams of result events."""
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator
+
+from gufe import AlchemicalNetwork
+from gufe.tokenization import GufeKey
+
+from .counts import ResultSummary
+from .strategy import IncrementalProposal, Strategy, StrategyResult
+
+_END = object()
+
+
+class AsyncProposer:
+    """Keep a proposal up to date from an asynchronous stream of
+    completion events.
+
+    Each event is a ``(transformation_key, new_count)`` tuple giving
+    the new number of ProtocolDAGResults of a Transformation. Events
+    arriving while a proposal is being updated are coalesced, so a
+    burst of completions triggers a single update. Updates use
+    :meth:`Strategy.incremental` and run in a worker thread, keeping
+    the event loop responsive. Concurrent updates are applied one at a
+    time, and ``result`` only ever returns the proposal published by
+    the last completed update.
+
+    Parameters
+    ----------
+    strategy: Strategy
+        The Strategy proposing the weights.
+    alchemical_network: AlchemicalNetwork
+        The AlchemicalNetwork containing the Transformations.
+    protocol_results: dict[GufeKey, ProtocolResult] | None
+        The ProtocolResults, ``ResultSummary`` objects or counts known
+        before the first event.
+    coalesce_delay: float
+        Seconds to wait after the first event of a burst for further
+        events before updating the proposal.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ResultSummary | int] | None = None,
+        *,
+        coalesce_delay: float = 0.0,
+    ):
+        if coalesce_delay < 0:
+            raise ValueError("`coalesce_delay` must be greater than or equal to 0")
+
+        self._proposal: IncrementalProposal = strategy.incremental(
+            alchemical_network, protocol_results or {}
+        )
+        self._result = self._proposal.result
+        self._coalesce_delay = coalesce_delay
+        # the proposal is not thread-safe, only one worker thread may
+        # update it at a time
+        self._lock = asyncio.Lock()
+
+    @property
+    def result(self) -> StrategyResult:
+        """The ``StrategyResult`` of the last completed update."""
+        return self._result
+
+    async def update(self, counts: dict[GufeKey, int]) -> StrategyResult:
+        """Update the proposal with new result counts in a worker thread."""
+        async with self._lock:
+            self._result = await asyncio.to_thread(self._proposal.update, counts)
+            return self._result
+
+    async def stream(
+        self, events: AsyncIterable[tuple[GufeKey, int]]
+    ) -> AsyncIterator[StrategyResult]:
+        """Consume completion events, yielding an updated
+        ``StrategyResult`` after each burst.
+
+        Parameters
+        ----------
+        events: AsyncIterable[tuple[GufeKey, int]]
+            ``(transformation_key, new_count)`` completion events.
+
+        Yields
+        ------
+        StrategyResult
+            The proposal after applying every event received since the
+            previous yield. ``StrategyResult.sample`` or
+            ``StrategyResult.top_k`` can turn it into a batch of
+            Transformations to submit.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def receive():
+            try:
+                async for event in events:
+                    queue.put_nowait(event)
+            finally:
+                queue.put_nowait(_END)
+
+        receiver = asyncio.create_task(receive())
+        try:
+            exhausted = False
+            while not exhausted:
+                event = await queue.get()
+                if event is _END:
+                    break
+
+                counts = dict([event])
+                if self._coalesce_delay:
+                    await asyncio.sleep(self._coalesce_delay)
+
+                # coalesce every event that arrived in the meantime,
+                # later events for the same Transformation win
+                while not queue.empty():
+                    event = queue.get_nowait()
+                    if event is _END:
+                        exhausted = True
+                        break
+                    transformation_key, count = event
+                    counts[transformation_key] = count
+
+                yield await self.update(counts)
+
+            # surface errors raised by the event stream
+            await receiver
+        finally:
+            receiver.cancel()
@@ -0,0 +1,438 @@
+import io
+import os
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Literal
+
+import numpy as np
+from gufe.tokenization import GufeKey
+
+if TYPE_CHECKING:
+    from .strategy import StrategyResult
+
+
+# identifies the binary format written by ArrayStrategyResult.save
+_MAGIC = b"\x93STRATOCASTER"
+_FORMAT_VERSION = 1
+
+
+class KeyTable:
+    """An immutable, ordered table of Transformation GufeKeys.
+
+    A KeyTable assigns each Transformation a fixed position, allowing
+    per-Transformation quantities to be stored in arrays. A single
+    table can be shared between many ``ArrayStrategyResult`` objects
+    for the same AlchemicalNetwork.
+
+    Parameters
+    ----------
+    keys: Iterable[GufeKey]
+        The Transformation GufeKeys, in table order.
+    """
+
+    def __init__(self, keys: Iterable[GufeKey]):
+        self._keys = tuple(keys)
+        self._positions = {key: position for position, key in enumerate(self._keys)}
+
+        if len(self._positions) != len(self._keys):
+            raise ValueError("KeyTable keys must be unique.")
+
+    @property
+    def keys(self) -> tuple[GufeKey, ...]:
+        return self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[GufeKey]:
+        return iter(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+
+    def __getitem__(self, position: int) -> GufeKey:
+        return self._keys[position]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, KeyTable):
+            return NotImplemented
+        return self is other or self._keys == other._keys
+
+    def __hash__(self) -> int:
+        return hash(self._keys)
+
+    def position(self, key: GufeKey) -> int:
+        """Get the position of a Transformation key in the table."""
+        return self._positions[key]
+
+    def positions(self, keys: Iterable[GufeKey]) -> np.ndarray:
+        """Get the positions of several Transformation keys in the table.
+
+        Raises
+        ------
+        KeyError
+            If any of the keys is not in the table.
+        """
+        positions = self._positions
+        return np.fromiter((positions[key] for key in keys), dtype=np.intp)
+
+
+class ArrayStrategyResult:
+    """A compact, array-backed form of a ``StrategyResult``.
+
+    Weights are stored in a float64 array aligned with a ``KeyTable``.
+    A ``None`` weight is stored as ``NaN``.
+
+    Parameters
+    ----------
+    key_table: KeyTable
+        The Transformation keys the weights are aligned with.
+    weights: np.ndarray
+        The Transformation weights, with ``NaN`` in place of ``None``.
+        A float64 array is used without copying and must not be
+        modified afterwards.
+    """
+
+    def __init__(self, key_table: KeyTable, weights: np.ndarray):
+        weights = np.asarray(weights, dtype=np.float64)
+
+        if weights.shape != (len(key_table),):
+            raise ValueError(
+                f"Expected a one-dimensional weights array of length {len(key_table)}, got shape {weights.shape}"
+            )
+
+        # store a read-only view so that handing out the weights never
+        # requires a copy
+        weights = weights.view()
+        weights.flags.writeable = False
+
+        self._key_table = key_table
+        self._weights = weights
+        self._cumulative_weights: np.ndarray | None = None
+
+    @property
+    def key_table(self) -> KeyTable:
+        return self._key_table
+
+    @property
+    def weights(self) -> np.ndarray:
+        """A read-only view of the weights, with ``NaN`` in place of ``None``."""
+        return self._weights
+
+    @property
+    def mask(self) -> np.ndarray:
+        """A boolean array that is ``True`` where the weight is not ``None``."""
+        return ~np.isnan(self._weights)
+
+    def __len__(self) -> int:
+        return len(self._key_table)
+
+    def resolve(self) -> np.ndarray:
+        """Get normalized proposal weights relative to all non-None
+        Transformation weights.
+
+        Returns
+        -------
+        np.ndarray
+            The normalized weights, with ``NaN`` in place of ``None``.
+        """
+        weights = self._weights
+        mask = self.mask
+
+        normalized = np.full_like(weights, np.nan)
+        if not mask.any():
+            return normalized
+
+        weight_sum = weights[mask].sum()
+        if weight_sum == 0:
+            raise ZeroDivisionError("float division by zero")
+
+        np.divide(weights, weight_sum, out=normalized, where=mask)
+        return normalized
+
+    def top_k(self, k: int) -> list[tuple[GufeKey, float]]:
+        """Get the ``k`` Transformations with the largest weights.
+
+        ``None`` weights are skipped. The selection uses a linear-time
+        partition and only sorts the selected weights.
+
+        Parameters
+        ----------
+        k: int
+            The maximum number of Transformations to return.
+
+        Returns
+        -------
+        list[tuple[GufeKey, float]]
+            Transformation keys paired with their unnormalized weights,
+            in descending order of weight. Ties are ordered by their
+            position in the key table.
+        """
+        (candidates,) = np.nonzero(self.mask)
+        k = min(k, len(candidates))
+        if k <= 0:
+            return []
+
+        candidate_weights = self._weights[candidates]
+        if k < len(candidates):
+            # the k-th largest weight, anything larger is always
+            # selected and ties are taken in key table order
+            threshold = np.partition(candidate_weights, len(candidates) - k)[
+                len(candidates) - k
+            ]
+            (above,) = np.nonzero(candidate_weights > threshold)
+            (tied,) = np.nonzero(candidate_weights == threshold)
+            selected = np.concatenate([above, tied[: k - len(above)]])
+        else:
+            selected = np.arange(len(candidates))
+
+        selected = selected[np.lexsort((selected, -candidate_weights[selected]))]
+
+        keys = self._key_table.keys
+        return [
+            (keys[position], weight)
+            for position, weight in zip(
+                candidates[selected].tolist(), candidate_weights[selected].tolist()
+            )
+        ]
+
+    def _cumulative(self) -> np.ndarray:
+        # built once, only None and zero weights contribute nothing
+        if self._cumulative_weights is None:
+            self._cumulative_weights = np.cumsum(
+                np.where(self._weights > 0, self._weights, 0.0)
+            )
+        return self._cumulative_weights
+
+    def sample(
+        self,
+        n: int,
+        replace: bool = True,
+        seed: int | np.random.Generator | None = None,
+    ) -> list[GufeKey]:
+        """Draw Transformation keys with probability proportional to
+        their weights.
+
+        Transformations with a ``None`` or zero weight are never drawn.
+        Draws with replacement use a cumulative weight index built once
+        per result, costing O(log n) each. Draws without replacement
+        use weighted random sort keys [1]_ and cost O(n) per batch.
+
+        Parameters
+        ----------
+        n: int
+            The number of keys to draw.
+        replace: bool
+            Whether a key can be drawn more than once.
+        seed: int | np.random.Generator | None
+            A seed or generator passed to ``numpy.random.default_rng``.
+
+        Returns
+        -------
+        list[GufeKey]
+
+        Raises
+        ------
+        ValueError
+            If there are no Transformations with a positive weight to
+            draw from, or if fewer than ``n`` are available when
+            drawing without replacement.
+
+        References
+        ----------
+        .. [1] P. S. Efraimidis and P. G. Spirakis, "Weighted random
+           sampling with a reservoir", Information Processing Letters
+           97, 181-185 (2006).
+        """
+        if n < 0:
+            raise ValueError("`n` must be greater than or equal to 0")
+
+        if n == 0:
+            return []
+
+        rng = np.random.default_rng(seed)
+        keys = self._key_table.keys
+
+        if replace:
+            cumulative = self._cumulative()
+            total = cumulative[-1] if len(cumulative) else 0.0
+            if not total > 0:
+                raise ValueError("No Transformations with a positive weight to sample")
+
+            positions = np.searchsorted(cumulative, rng.random(n) * total, side="right")
+            # guard against rounding up to the total weight
+            last_position = np.searchsorted(cumulative, total, side="left")
+            np.minimum(positions, last_position, out=positions)
+            return [keys[position] for position in positions.tolist()]
+
+        (candidates,) = np.nonzero(self._weights > 0)
+        if len(candidates) < n:
+            raise ValueError(
+                f"Cannot sample {n} keys without replacement from {len(candidates)} Transformations with a positive weight"
+            )
+
+        # the n largest keys log(u) / w are a weighted sample without
+        # replacement, in the order they would have been drawn
+        sort_keys = np.log(rng.random(len(candidates))) / self._weights[candidates]
+        selected = np.argpartition(-sort_keys, n - 1)[:n]
+        selected = selected[np.argsort(-sort_keys[selected], kind="stable")]
+        return [keys[position] for position in candidates[selected].tolist()]
+
+    @classmethod
+    def from_strategy_result(
+        cls, result: "StrategyResult", key_table: KeyTable | None = None
+    ) -> "ArrayStrategyResult":
+        """Convert a ``StrategyResult`` into its array-backed form.
+
+        Parameters
+        ----------
+        result: StrategyResult
+        key_table: KeyTable | None
+            An existing table to align the weights with. Keys of the
+            table missing from ``result`` are assigned a ``None``
+            weight. If not provided, a new table is created from the
+            keys of ``result``.
+
+        Returns
+        -------
+        ArrayStrategyResult
+
+        Raises
+        ------
+        KeyError
+            If ``result`` contains a key that is not in ``key_table``.
+        """
+        result_weights = result._weights
+        values = np.fromiter(
+            (
+                np.nan if weight is None else weight
+                for weight in result_weights.values()
+            ),
+            dtype=np.float64,
+            count=len(result_weights),
+        )
+
+        if key_table is None:
+            return cls(KeyTable(result_weights.keys()), values)
+
+        weights = np.full(len(key_table), np.nan)
+        weights[key_table.positions(result_weights.keys())] = values
+        return cls(key_table, weights)
+
+    def to_strategy_result(self) -> "StrategyResult":
+        """Convert back into a dictionary-backed ``StrategyResult``."""
+        from .strategy import StrategyResult
+
+        return StrategyResult(
+            {
+                key: None if weight != weight else weight
+                for key, weight in zip(self._key_table.keys, self._weights.tolist())
+            }
+        )
+
+    def save(self, file: str | os.PathLike | BinaryIO):
+        """Write the result in a compact binary format.
+
+        The file holds a short header followed by two NumPy ``.npy``
+        arrays: the Transformation keys as ASCII bytes and the float64
+        weights, with ``NaN`` in place of ``None``. The arrays are
+        written directly without any JSON encoding.
+
+        Parameters
+        ----------
+        file: str | os.PathLike | BinaryIO
+            A path or a binary file object to write to.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as f:
+                self.save(f)
+            return
+
+        keys = np.array([key.encode("ascii") for key in self._key_table], dtype=bytes)
+
+        file.write(_MAGIC + bytes([_FORMAT_VERSION]))
+        np.lib.format.write_array(file, keys, allow_pickle=False)
+        np.lib.format.write_array(
+            file, np.ascontiguousarray(self._weights), allow_pickle=False
+        )
+
+    @classmethod
+    def load(
+        cls,
+        file: str | os.PathLike | BinaryIO,
+        mmap_mode: Literal["r", "c"] | None = None,
+    ) -> "ArrayStrategyResult":
+        """Read a result written by :meth:`save`.
+
+        Parameters
+        ----------
+        file: str | os.PathLike | BinaryIO
+            A path or a binary file object to read from. File objects
+            are read sequentially, so streams such as sockets or pipes
+            can be used.
+        mmap_mode: "r" | "c" | None
+            If set, the weights are memory-mapped from the file instead
+            of being read into memory, using the given
+            ``numpy.memmap`` mode. Requires ``file`` to be a path.
+
+        Returns
+        -------
+        ArrayStrategyResult
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                if mmap_mode is None:
+                    return cls.load(f)
+
+                key_table = cls._read_key_table(f)
+                match np.lib.format.read_magic(f):
+                    case (1, 0):
+                        header = np.lib.format.read_array_header_1_0(f)
+                    case (2, 0):
+                        header = np.lib.format.read_array_header_2_0(f)
+                    case version:
+                        raise ValueError(f"Unsupported .npy format version {version}")
+                shape, fortran_order, dtype = header
+
+                # empty files can't be memory-mapped
+                if not len(key_table):
+                    return cls(key_table, np.empty(shape, dtype=dtype))
+
+                weights = np.memmap(
+                    file,
+                    dtype=dtype,
+                    mode=mmap_mode,
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+                return cls(key_table, weights)
+
+        if mmap_mode is not None:
+            raise ValueError("`mmap_mode` requires `file` to be a path")
+
+        key_table = cls._read_key_table(file)
+        weights = np.lib.format.read_array(file, allow_pickle=False)
+        return cls(key_table, weights)
+
+    @staticmethod
+    def _read_key_table(file: BinaryIO) -> KeyTable:
+        header = file.read(len(_MAGIC) + 1)
+        if header[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a serialized ArrayStrategyResult")
+        if header[len(_MAGIC)] != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported ArrayStrategyResult format version {header[len(_MAGIC)]}"
+            )
+
+        keys = np.lib.format.read_array(file, allow_pickle=False)
+        return KeyTable(GufeKey(key.decode("ascii")) for key in keys.tolist())
+
+    def to_bytes(self) -> bytes:
+        """Serialize the result with :meth:`save` into bytes."""
+        buffer = io.BytesIO()
+        self.save(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ArrayStrategyResult":
+        """Deserialize a result produced by :meth:`to_bytes`."""
+        return cls.load(io.BytesIO(data))
@@ -0,0 +1,143 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# marks a missing value, since None can be stored
+_absent: Any = object()
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    """A snapshot of the usage of a ``KeyedCache``.
+
+    ``evictions`` counts values removed to respect ``maxsize`` as well
+    as values that expired.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class KeyedCache(Generic[T]):
+    """A thread-safe, size-bounded least-recently-used cache.
+
+    Values are typically derived from a GufeTokenizable and stored
+    under its ``GufeKey``. Since GufeTokenizables are immutable, a
+    value stored under a key never has to be invalidated.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of values held before the least recently
+        used value is evicted.
+    ttl: float | None
+        If set, the number of seconds after which a stored value
+        expires.
+    timer: Callable[[], float]
+        The clock used for expiration, in seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be greater than or equal to 1")
+
+        if ttl is not None and not ttl > 0:
+            raise ValueError("`ttl` must be greater than 0")
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        # values paired with their expiration time
+        self._data: OrderedDict[Hashable, tuple[T, float | None]] = OrderedDict()
+        self._lock = RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        return self._ttl
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                maxsize=self._maxsize,
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _absent
+
+    def _lookup(self, key: Hashable):
+        try:
+            value, expires = self._data[key]
+        except KeyError:
+            return _absent
+
+        if expires is not None and self._timer() >= expires:
+            del self._data[key]
+            self._evictions += 1
+            return _absent
+
+        self._data.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: T | None = None) -> T | None:
+        with self._lock:
+            value = self._lookup(key)
+            if value is _absent:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: T):
+        with self._lock:
+            expires = None if self._ttl is None else self._timer() + self._ttl
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Get the value stored under ``key``, calling ``compute`` to
+        create and store it if it is missing."""
+        value = self.get(key, _absent)
+        if value is not _absent:
+            return value
+
+        # compute outside of the lock so that slow computations for
+        # different keys can proceed concurrently
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
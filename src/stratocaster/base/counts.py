@@ -0,0 +1,55 @@
+from numbers import Integral
+from typing import Mapping, Protocol, runtime_checkable
+
+from gufe.tokenization import GufeKey
+
+
+@runtime_checkable
+class ResultSummary(Protocol):
+    """The part of a ProtocolResult read by the built-in strategies.
+
+    ``ProtocolResult`` satisfies this protocol, as does any lightweight
+    object exposing ``n_protocol_dag_results``, e.g. a record read from
+    a table of result counts.
+    """
+
+    @property
+    def n_protocol_dag_results(self) -> int: ...
+
+
+def result_count(result: ResultSummary | int | None) -> int:
+    """Get the number of ProtocolDAGResults of a Transformation.
+
+    Parameters
+    ----------
+    result: ResultSummary | int | None
+        A ProtocolResult, a ``ResultSummary``, a plain count, or
+        ``None`` for a Transformation without results.
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    TypeError
+        If ``result`` is a ``bool``.
+    """
+    match result:
+        case None:
+            return 0
+        # a bool is an int, but never a meaningful count
+        case bool():
+            raise TypeError("A result count must be an integer, not a bool")
+        # also matches NumPy integers, e.g. counts read from an array
+        case Integral():
+            return int(result)
+        case _:
+            return result.n_protocol_dag_results
+
+
+def result_counts(
+    protocol_results: Mapping[GufeKey, ResultSummary | int],
+) -> dict[GufeKey, int]:
+    """Reduce ProtocolResults to their ProtocolDAGResult counts."""
+    return {key: result_count(result) for key, result in protocol_results.items()}
@@ -0,0 +1,112 @@
+import hashlib
+import time
+from concurrent.futures import Executor
+from typing import Callable
+
+from gufe import AlchemicalNetwork
+from gufe.tokenization import GufeKey
+
+from .cache import CacheStatistics, KeyedCache
+from .counts import ResultSummary
+from .strategy import Strategy, StrategyResult
+
+
+class ProposalCache:
+    """Memoize ``Strategy.propose`` for repeated identical requests.
+
+    Proposals are cached under the GufeKey of the Strategy, which
+    reflects its settings, the GufeKey of the AlchemicalNetwork and a
+    fingerprint of the result counts of the network's Transformations.
+    Since the built-in strategies only depend on these counts,
+    requests with equal counts share a cached proposal, even when they
+    pass different ProtocolResult objects. Strategies reading more than
+    the result counts should not be memoized with this cache.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of proposals held before the least recently
+        used one is evicted.
+    ttl: float | None
+        If set, the number of seconds after which a cached proposal
+        expires.
+    timer: Callable[[], float]
+        The clock used for expiration, in seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._cache: KeyedCache[StrategyResult] = KeyedCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Hit, miss and eviction counts of the cache."""
+        return self._cache.statistics
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    @staticmethod
+    def fingerprint(
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ResultSummary | int],
+    ) -> str:
+        """Hash the result counts of the Transformations in a network.
+
+        Results for Transformations outside the network are ignored.
+        """
+        # avoid a circular import, the network package depends on base
+        from stratocaster.network import NetworkIndex
+
+        counts = NetworkIndex.from_network(alchemical_network).counts(protocol_results)
+        return hashlib.blake2b(counts.tobytes(), digest_size=16).hexdigest()
+
+    def propose(
+        self,
+        strategy: Strategy,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ResultSummary | int],
+        *,
+        executor: Executor | None = None,
+    ) -> StrategyResult:
+        """Get the proposal of ``strategy``, computing it only if an
+        identical request is not cached.
+
+        Parameters
+        ----------
+        strategy: Strategy
+            The Strategy proposing the weights.
+        alchemical_network: AlchemicalNetwork
+            The AlchemicalNetwork containing the Transformations.
+        protocol_results: dict[GufeKey, ProtocolResult]
+            A dictionary of Transformation GufeKeys paired with the
+            Transformation's ProtocolResults, ``ResultSummary`` objects
+            or counts.
+        executor: Executor | None
+            An optional ``concurrent.futures.Executor`` used on a cache
+            miss, see :meth:`Strategy.propose`.
+
+        Returns
+        -------
+        StrategyResult
+        """
+        key = (
+            strategy.key,
+            alchemical_network.key,
+            self.fingerprint(alchemical_network, protocol_results),
+        )
+        return self._cache.get_or_compute(
+            key,
+            lambda: strategy.propose(
+                alchemical_network, protocol_results, executor=executor
+            ),
+        )
@@ -1,12 +1,40 @@
 import abc
-from typing import TypeVar
+import heapq
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, TypeVar
 
+import numpy as np
 from gufe import AlchemicalNetwork, ProtocolResult
 from gufe.tokenization import GufeKey, GufeTokenizable
 
+from .arrays import ArrayStrategyResult, KeyTable
+from .counts import ResultSummary
 from .models import StrategySettings
+from .tracing import current_tracer
 
-TProtocolResult = TypeVar("TProtocolResult", bound=ProtocolResult)
+if TYPE_CHECKING:
+    from stratocaster.network import NetworkIndex
+
+TProtocolResult = TypeVar("TProtocolResult", bound=ProtocolResult | ResultSummary | int)
+
+
+# distinguishes absent weights from None weights
+_missing = object()
+
+
+def _propose_chunk(
+    strategy: "Strategy",
+    chunk: list[tuple[int, AlchemicalNetwork, dict[GufeKey, TProtocolResult]]],
+) -> list[tuple[int, "StrategyResult"]]:
+    """Propose every network of a chunk submitted by ``propose_batch``."""
+    return [
+        (index, strategy.propose(alchemical_network, protocol_results))
+        for index, alchemical_network, protocol_results in chunk
+    ]
 
 
 class StrategyResult(GufeTokenizable):
@@ -14,6 +42,17 @@ class StrategyResult(GufeTokenizable):
 
     def __init__(self, weights: dict[GufeKey, float | None]):
         self._weights = weights
+        self._array_result: ArrayStrategyResult | None = None
+
+    def __getattr__(self, name: str):
+        # only called for missing attributes, the weights of a snapshot
+        # published by a VersionedProposal are built on first use
+        if name == "_weights" and "_snapshot" in self.__dict__:
+            self._weights = self.__dict__.pop("_snapshot").materialize()
+            return self._weights
+        raise AttributeError(
+            f"{type(self).__qualname__!r} object has no attribute {name!r}"
+        )
 
     @classmethod
     def _defaults(cls):
@@ -42,12 +81,452 @@ class StrategyResult(GufeTokenizable):
         }
         return normalized_weights
 
+    def to_array(self, key_table: KeyTable | None = None) -> ArrayStrategyResult:
+        """Convert into the compact, array-backed ``ArrayStrategyResult``.
+
+        Parameters
+        ----------
+        key_table: KeyTable | None
+            An existing table to align the weights with. If not
+            provided, a new table is created from the keys of this
+            result.
+
+        Returns
+        -------
+        ArrayStrategyResult
+        """
+        return ArrayStrategyResult.from_strategy_result(self, key_table)
+
+    def top_k(self, k: int) -> list[tuple[GufeKey, float]]:
+        """Get the ``k`` Transformations with the largest weights.
+
+        ``None`` weights are skipped. The selection uses a heap of size
+        ``k`` and does not copy or normalize the weights.
+
+        Parameters
+        ----------
+        k: int
+            The maximum number of Transformations to return.
+
+        Returns
+        -------
+        list[tuple[GufeKey, float]]
+            Transformation keys paired with their unnormalized weights,
+            in descending order of weight. Ties are ordered as in
+            ``weights``.
+        """
+        return heapq.nlargest(
+            k,
+            (
+                (key, weight)
+                for key, weight in self._weights.items()
+                if weight is not None
+            ),
+            key=lambda item: item[1],
+        )
+
+    def iter_descending(self) -> Iterator[tuple[GufeKey, float]]:
+        """Iterate over the Transformations in descending order of weight.
+
+        ``None`` weights are skipped. The heap is built in linear time
+        and each step costs O(log n), so consuming only the first few
+        items avoids sorting every weight.
+
+        Yields
+        ------
+        tuple[GufeKey, float]
+            Transformation keys paired with their unnormalized weights.
+            Ties are ordered as in ``weights``.
+        """
+        heap = [
+            (-weight, position, key)
+            for position, (key, weight) in enumerate(self._weights.items())
+            if weight is not None
+        ]
+        heapq.heapify(heap)
+        while heap:
+            negative_weight, _, key = heapq.heappop(heap)
+            yield key, -negative_weight
+
+    def sample(
+        self,
+        n: int,
+        replace: bool = True,
+        seed: int | np.random.Generator | None = None,
+    ) -> list[GufeKey]:
+        """Draw Transformation keys with probability proportional to
+        their weights.
+
+        Transformations with a ``None`` or zero weight are never
+        drawn. The sampling index is built on the first call and reused
+        by later calls on the same result. See
+        :meth:`ArrayStrategyResult.sample` for details.
+
+        Parameters
+        ----------
+        n: int
+            The number of keys to draw.
+        replace: bool
+            Whether a key can be drawn more than once.
+        seed: int | np.random.Generator | None
+            A seed or generator passed to ``numpy.random.default_rng``.
+
+        Returns
+        -------
+        list[GufeKey]
+        """
+        if self._array_result is None:
+            self._array_result = self.to_array()
+        return self._array_result.sample(n, replace=replace, seed=seed)
+
+    def delta(self, previous: "StrategyResult") -> "StrategyResultDelta":
+        """Get the changes from a previous StrategyResult to this one.
+
+        Parameters
+        ----------
+        previous: StrategyResult
+            The StrategyResult to compare against.
+
+        Returns
+        -------
+        StrategyResultDelta
+            The weights that changed, became ``None`` or appeared, and
+            the keys that are no longer present.
+        """
+        previous_weights = previous._weights
+        changed = {
+            transformation_key: weight
+            for transformation_key, weight in self._weights.items()
+            if previous_weights.get(transformation_key, _missing) != weight
+        }
+        removed = previous_weights.keys() - self._weights.keys()
+        return StrategyResultDelta(changed, removed)
+
+    @classmethod
+    def merge(cls, results: Iterable["StrategyResult"]) -> "StrategyResult":
+        """Combine StrategyResults with mutually exclusive
+        Transformation keys in a single pass.
+
+        Parameters
+        ----------
+        results: Iterable[StrategyResult]
+            The StrategyResults to combine.
+
+        Returns
+        -------
+        StrategyResult
+
+        Raises
+        ------
+        ValueError
+            If any Transformation key is present in more than one
+            StrategyResult.
+        """
+        weights: dict[GufeKey, float | None] = {}
+        expected_size = 0
+        for result in results:
+            weights.update(result._weights)
+            expected_size += len(result._weights)
+            # any shared key collapses into a single entry
+            if len(weights) != expected_size:
+                raise ValueError(
+                    "StrategyResults can only be combined when their transformation keys are mutually exclusive."
+                )
+        return cls(weights)
+
     def __or__(self, other):
-        if self.weights.keys() & other.weights.keys():
-            raise ValueError(
-                "StrategyResults can only be combined when their transformation keys are mutually exclusive."
+        return StrategyResult.merge((self, other))
+
+
+class StrategyResultDelta(GufeTokenizable):
+    """The changes turning one StrategyResult into another.
+
+    Parameters
+    ----------
+    changed: dict[GufeKey, float | None]
+        The new weights of the Transformations whose weight changed,
+        became ``None``, or that were not previously present.
+    removed: Iterable[GufeKey]
+        The keys of Transformations no longer present.
+    """
+
+    def __init__(
+        self,
+        changed: dict[GufeKey, float | None],
+        removed: Iterable[GufeKey] = (),
+    ):
+        self._changed = changed
+        self._removed = frozenset(removed)
+
+    @classmethod
+    def _defaults(cls):
+        return {}
+
+    def _to_dict(self) -> dict:
+        return {"changed": self._changed, "removed": sorted(self._removed)}
+
+    # TODO: Return type from typing.Self when Python 3.10 is no longer supported
+    @classmethod
+    def _from_dict(cls, dct: dict):
+        return cls(**dct)
+
+    @property
+    def changed(self) -> dict[GufeKey, float | None]:
+        return self._changed.copy()
+
+    @property
+    def removed(self) -> frozenset[GufeKey]:
+        return self._removed
+
+    def __len__(self) -> int:
+        return len(self._changed) + len(self._removed)
+
+    def apply(self, previous: StrategyResult) -> StrategyResult:
+        """Apply the changes to the StrategyResult they were computed
+        against."""
+        weights = previous.weights
+        for transformation_key in self._removed:
+            del weights[transformation_key]
+        weights.update(self._changed)
+        return StrategyResult(weights)
+
+
+class IncrementalProposal(abc.ABC):
+    """A stateful proposal for a single AlchemicalNetwork that can be
+    updated as new ProtocolResults arrive.
+
+    Instances are created with :meth:`Strategy.incremental`. Calling
+    :meth:`update` with only the entries of ``protocol_results`` that
+    changed since the last call yields the same ``StrategyResult`` as
+    calling :meth:`Strategy.propose` with the complete, updated set of
+    results.
+    """
+
+    def __init__(
+        self,
+        strategy: "Strategy",
+        alchemical_network: AlchemicalNetwork,
+    ):
+        self._strategy = strategy
+        self._alchemical_network = alchemical_network
+
+    @property
+    def strategy(self) -> "Strategy":
+        return self._strategy
+
+    @property
+    def alchemical_network(self) -> AlchemicalNetwork:
+        return self._alchemical_network
+
+    @property
+    @abc.abstractmethod
+    def result(self) -> StrategyResult:
+        """The ``StrategyResult`` reflecting all results seen so far."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(
+        self, protocol_results: dict[GufeKey, TProtocolResult]
+    ) -> StrategyResult:
+        """Update the proposal with new or changed ProtocolResults.
+
+        The built-in strategies implement :class:`VersionedProposal`,
+        whose updates cost time proportional to the number of changed
+        weights. Use :meth:`update_delta` to get only the changes.
+
+        Parameters
+        ----------
+        protocol_results: dict[GufeKey, ProtocolResult]
+            Transformation GufeKeys paired with their new
+            ProtocolResults. Only entries that changed since the
+            previous update need to be provided.
+
+        Returns
+        -------
+        StrategyResult
+        """
+        raise NotImplementedError
+
+    def update_delta(
+        self, protocol_results: dict[GufeKey, TProtocolResult]
+    ) -> StrategyResultDelta:
+        """Update the proposal, returning only the weights that changed.
+
+        Parameters
+        ----------
+        protocol_results: dict[GufeKey, ProtocolResult]
+            Transformation GufeKeys paired with their new
+            ProtocolResults.
+
+        Returns
+        -------
+        StrategyResultDelta
+            The changes from the previous ``result`` to the updated one.
+        """
+        previous = self.result
+        return self.update(protocol_results).delta(previous)
+
+
+class RecomputedProposal(IncrementalProposal):
+    """An ``IncrementalProposal`` that recomputes the full proposal on
+    every update.
+
+    This is the fallback used by strategies that do not provide a
+    specialized incremental implementation.
+    """
+
+    def __init__(
+        self,
+        strategy: "Strategy",
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, TProtocolResult],
+    ):
+        super().__init__(strategy, alchemical_network)
+        self._protocol_results = dict(protocol_results)
+        self._result = strategy.propose(alchemical_network, self._protocol_results)
+
+    @property
+    def result(self) -> StrategyResult:
+        return self._result
+
+    def update(
+        self, protocol_results: dict[GufeKey, TProtocolResult]
+    ) -> StrategyResult:
+        self._protocol_results.update(protocol_results)
+        self._result = self._strategy.propose(
+            self._alchemical_network, self._protocol_results
+        )
+        return self._result
+
+
+class _WeightsSnapshot:
+    """The weights of a VersionedProposal at one version."""
+
+    __slots__ = ("_proposal", "_version", "__weakref__")
+
+    def __init__(self, proposal: "VersionedProposal", version: int):
+        self._proposal = proposal
+        self._version = version
+
+    def materialize(self) -> dict[GufeKey, float | None]:
+        return self._proposal._materialize(self)
+
+    def __reduce__(self):
+        # pickle the weights rather than the proposal
+        return _MaterializedSnapshot, (self.materialize(),)
+
+
+class _MaterializedSnapshot:
+    """Weights of a snapshot that was pickled before their first use."""
+
+    __slots__ = ("_weights",)
+
+    def __init__(self, weights: dict[GufeKey, float | None]):
+        self._weights = weights
+
+    def materialize(self) -> dict[GufeKey, float | None]:
+        return self._weights
+
+
+class VersionedProposal(IncrementalProposal):
+    """An ``IncrementalProposal`` whose updates cost time proportional
+    to the number of changed weights.
+
+    The current weights are kept in a single dict, which updates
+    change in place. Every change is also recorded in a log, so the
+    ``StrategyResult`` of an earlier version can still be built by
+    copying the current weights and undoing the later changes. A
+    published ``StrategyResult`` only does so on first use, and log
+    entries are dropped once no unused ``StrategyResult`` needs them.
+    Creating and discarding results is therefore free, while using one
+    costs time proportional to the size of the network, as does any
+    copy of its weights.
+
+    Subclasses set the initial ``_weights`` and apply changes with
+    ``_apply``, from an implementation of ``_reweigh``.
+    """
+
+    def __init__(
+        self,
+        strategy: "Strategy",
+        alchemical_network: AlchemicalNetwork,
+    ):
+        super().__init__(strategy, alchemical_network)
+        self._weights: dict[GufeKey, float | None] = {}
+        self._version = 0
+        # (version, key, previous weight) of every change since the
+        # version of the oldest unused snapshot
+        self._log: deque[tuple[int, GufeKey, float | None]] = deque()
+        self._pending: weakref.WeakSet[_WeightsSnapshot] = weakref.WeakSet()
+        self._published: weakref.ref[StrategyResult] | None = None
+        # snapshots can be used from other threads than updates
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _reweigh(
+        self, protocol_results: dict[GufeKey, TProtocolResult]
+    ) -> dict[GufeKey, float | None]:
+        """Apply new results, returning the weights that changed."""
+        raise NotImplementedError
+
+    def _apply(self, changed: dict[GufeKey, float | None]):
+        """Change weights in place, creating a new version."""
+        if not changed:
+            return
+
+        with self._lock:
+            self._version += 1
+            self._published = None
+
+            oldest = min(
+                (snapshot._version for snapshot in self._pending),
+                default=self._version,
             )
-        return StrategyResult(self.weights | other.weights)
+            while self._log and self._log[0][0] <= oldest:
+                self._log.popleft()
+
+            weights = self._weights
+            if self._pending:
+                self._log.extend((self._version, key, weights[key]) for key in changed)
+            weights.update(changed)
+
+    def _materialize(self, snapshot: _WeightsSnapshot) -> dict[GufeKey, float | None]:
+        with self._lock:
+            self._pending.discard(snapshot)
+            weights = self._weights.copy()
+            for version, key, previous in reversed(self._log):
+                if version <= snapshot._version:
+                    break
+                weights[key] = previous
+        return weights
+
+    @property
+    def result(self) -> StrategyResult:
+        result = self._published() if self._published is not None else None
+        if result is None:
+            snapshot = _WeightsSnapshot(self, self._version)
+            with self._lock:
+                self._pending.add(snapshot)
+
+            # bypass __init__, the weights are only built on first use
+            result = StrategyResult.__new__(StrategyResult)
+            result._array_result = None
+            result._snapshot = snapshot
+            self._published = weakref.ref(result)
+        return result
+
+    def update(
+        self, protocol_results: dict[GufeKey, TProtocolResult]
+    ) -> StrategyResult:
+        self._reweigh(protocol_results)
+        return self.result
+
+    def update_delta(
+        self, protocol_results: dict[GufeKey, TProtocolResult]
+    ) -> StrategyResultDelta:
+        # only the reweighed Transformations can change, so the delta
+        # is found without comparing the full set of weights
+        return StrategyResultDelta(self._reweigh(protocol_results))
 
 
 class Strategy(GufeTokenizable):
@@ -110,10 +589,67 @@ class Strategy(GufeTokenizable):
     ) -> StrategyResult:
         raise NotImplementedError
 
+    def _propose_index(
+        self,
+        network_index: "NetworkIndex",
+        protocol_results: dict[GufeKey, TProtocolResult],
+    ) -> StrategyResult:
+        """Propose weights from the compiled index of a connected
+        AlchemicalNetwork.
+
+        Implementing this method is optional. Strategies that do so
+        can implement ``_propose`` by passing it the cached index,
+        ``NetworkIndex.from_network(alchemical_network)``, which is
+        shared with every other strategy proposing the same network.
+        """
+        raise NotImplementedError
+
+    def _propose_counts(
+        self,
+        network_index: "NetworkIndex",
+        counts: np.ndarray,
+    ) -> StrategyResult:
+        """Propose weights from the ProtocolDAGResult counts of the
+        Transformations of a connected AlchemicalNetwork.
+
+        Implementing this method is optional, for strategies whose
+        weights only depend on result counts. Their ``_propose_index``
+        can pass it ``network_index.counts(protocol_results)``, while a
+        CompositeStrategy resolves the counts only once for all of its
+        children.
+        """
+        raise NotImplementedError
+
+    def _extends(self, method: str, base_method: str) -> bool:
+        """Whether ``method`` is implemented by the class defining
+        ``base_method``, or by a class deriving from it."""
+        mro = type(self).__mro__
+        owner = next(cls for cls in mro if method in vars(cls))
+        base_owner = next(cls for cls in mro if base_method in vars(cls))
+        return owner is not Strategy and issubclass(owner, base_owner)
+
+    @property
+    def _indexed(self) -> bool:
+        """Whether this Strategy proposes through ``_propose_index``.
+
+        ``_propose`` remains the extension point of subclasses, so
+        ``_propose_index`` is only used when it is defined by the same
+        class as ``_propose``, or by a class deriving from it.
+        """
+        return self._extends("_propose_index", "_propose")
+
+    @property
+    def _counted(self) -> bool:
+        """Whether this Strategy can propose through ``_propose_counts``
+        in place of ``_propose_index``."""
+        return self._indexed and self._extends("_propose_counts", "_propose_index")
+
     def propose(
         self,
         alchemical_network: AlchemicalNetwork,
         protocol_results: dict[GufeKey, TProtocolResult],
+        *,
+        executor: Executor | None = None,
     ) -> StrategyResult:
         """Compute Transformation weights from the ProtocolResults of
         the Transformations.
@@ -124,15 +660,244 @@ class Strategy(GufeTokenizable):
             The AlchemicalNetwork containing the Transformations.
         protocol_results: dict[GufeKey, ProtocolResult]
             A dictionary of Transformation GufeKeys paired with the
-            Transformation's ProtocolResults.
+            Transformation's ProtocolResults. Any ``ResultSummary``,
+            such as a lightweight record, or a plain count of
+            ProtocolDAGResults can be used in place of a full
+            ProtocolResult.
+        executor: Executor | None
+            An optional ``concurrent.futures.Executor``, such as a
+            ``ThreadPoolExecutor`` or ``ProcessPoolExecutor``, used to
+            propose weights for each connected subgraph of the network
+            concurrently. The number of workers is determined by the
+            executor. The result is identical to the serial proposal.
 
         Returns
         -------
         StrategyResult
 
+        Notes
+        -----
+        When called within an active
+        :class:`~stratocaster.base.tracing.ProposeTracer`, the time
+        spent in each phase of the proposal is recorded.
+
+        """
+        tracer = current_tracer()
+        if tracer is None:
+            return StrategyResult.merge(
+                self._propose_components(
+                    self._components(alchemical_network), protocol_results, executor
+                )
+            )
+
+        with tracer.record(self, alchemical_network) as record:
+            with record.phase("components"):
+                components = list(self._components(alchemical_network))
+            with record.phase("propose"):
+                results = list(
+                    self._propose_components(components, protocol_results, executor)
+                )
+            with record.phase("merge"):
+                result = StrategyResult.merge(results)
+
+            record.n_components = len(components)
+            record.n_edges = sum(
+                len(self._component_edge_keys(component)) for component in components
+            )
+            record.n_weights = len(result._weights)
+
+        return result
+
+    def _components(
+        self, alchemical_network: AlchemicalNetwork
+    ) -> "Iterable[NetworkIndex] | Iterable[AlchemicalNetwork]":
+        """Split a network into its connected components.
+
+        Strategies implementing ``_propose_index`` get the components
+        cached with the network's ``NetworkIndex``. Other strategies
+        get new AlchemicalNetworks from ``connected_subgraphs``.
+        """
+        if self._indexed:
+            from stratocaster.network import NetworkIndex
+
+            return NetworkIndex.from_network(alchemical_network).components
+        return alchemical_network.connected_subgraphs()
+
+    def _component_edge_keys(
+        self, component: "NetworkIndex | AlchemicalNetwork"
+    ) -> "Iterable[GufeKey]":
+        if self._indexed:
+            return component.edge_keys
+        return [transformation.key for transformation in component.edges]
+
+    def _propose_components(
+        self,
+        components: "Iterable[NetworkIndex] | Iterable[AlchemicalNetwork]",
+        protocol_results: dict[GufeKey, TProtocolResult],
+        executor: Executor | None,
+    ) -> Iterator[StrategyResult]:
+        """Propose each connected component, in order."""
+        propose = self._propose_index if self._indexed else self._propose
+
+        if executor is None:
+            for component in components:
+                yield propose(component, protocol_results)
+            return
+
+        # only send the results relevant to each component, which keeps
+        # the data transferred to process pool workers small
+        futures = [
+            executor.submit(
+                propose,
+                component,
+                {
+                    key: protocol_results[key]
+                    for key in self._component_edge_keys(component)
+                    if key in protocol_results
+                },
+            )
+            for component in components
+        ]
+
+        # yield in submission order to match the serial proposal
+        for future in futures:
+            yield future.result()
+
+    def propose_batch(
+        self,
+        items: Iterable[tuple[AlchemicalNetwork, dict[GufeKey, TProtocolResult]]],
+        *,
+        max_workers: int | None = None,
+        chunksize: int = 1,
+        executor: Executor | None = None,
+    ) -> Iterator[tuple[int, StrategyResult]]:
+        """Compute Transformation weights for many AlchemicalNetworks
+        concurrently.
+
+        Each network is proposed as with :meth:`propose`, in a pool of
+        worker processes. Proposals are yielded as soon as they
+        complete, which is not necessarily in the order of ``items``.
+
+        Parameters
+        ----------
+        items: Iterable[tuple[AlchemicalNetwork, dict[GufeKey, ProtocolResult]]]
+            Pairs of an AlchemicalNetwork and the ProtocolResults of its
+            Transformations. As every pair is sent to a worker process,
+            passing ``ResultSummary`` records or plain counts in place
+            of full ProtocolResults keeps the transfer small.
+        max_workers: int | None
+            The number of worker processes, ignored if ``executor`` is
+            given. Defaults to the number of processors.
+        chunksize: int
+            The number of networks sent to a worker at once. Larger
+            chunks amortize the transfer overhead over many small
+            networks.
+        executor: Executor | None
+            An optional ``concurrent.futures.Executor`` to use instead
+            of a new ``ProcessPoolExecutor``, which allows a pool to be
+            reused between scheduling cycles. It is not shut down.
+
+        Returns
+        -------
+        Iterator[tuple[int, StrategyResult]]
+            The position of each network in ``items`` and its proposal.
+
+        Raises
+        ------
+        ValueError
+            If ``chunksize`` is less than 1.
+
+        """
+        # validate before creating the generator, which would only
+        # raise on the first iteration
+        if chunksize < 1:
+            raise ValueError("`chunksize` must be at least 1")
+
+        return self._propose_batch(items, max_workers, chunksize, executor)
+
+    def _propose_batch(
+        self,
+        items: Iterable[tuple[AlchemicalNetwork, dict[GufeKey, TProtocolResult]]],
+        max_workers: int | None,
+        chunksize: int,
+        executor: Executor | None,
+    ) -> Iterator[tuple[int, StrategyResult]]:
+        indexed_items = (
+            (index, alchemical_network, protocol_results)
+            for index, (alchemical_network, protocol_results) in enumerate(items)
+        )
+
+        pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+        futures = []
+        try:
+            while chunk := list(islice(indexed_items, chunksize)):
+                futures.append(pool.submit(_propose_chunk, self, chunk))
+
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            # the caller may stop iterating early
+            for future in futures:
+                future.cancel()
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+
+    def propose_delta(
+        self,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, TProtocolResult],
+        previous: StrategyResult,
+        *,
+        executor: Executor | None = None,
+    ) -> StrategyResultDelta:
+        """Compute Transformation weights and return only the changes
+        relative to a previous proposal.
+
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+            The AlchemicalNetwork containing the Transformations.
+        protocol_results: dict[GufeKey, ProtocolResult]
+            A dictionary of Transformation GufeKeys paired with the
+            Transformation's ProtocolResults.
+        previous: StrategyResult
+            The previous proposal to compare against.
+        executor: Executor | None
+            An optional ``concurrent.futures.Executor``, see
+            :meth:`propose`.
+
+        Returns
+        -------
+        StrategyResultDelta
+
+        """
+        return self.propose(
+            alchemical_network, protocol_results, executor=executor
+        ).delta(previous)
+
+    def incremental(
+        self,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, TProtocolResult],
+    ) -> IncrementalProposal:
+        """Create a stateful proposal that can be cheaply updated as
+        new ProtocolResults arrive.
+
+        Strategies may override this method to cache structure derived
+        from the AlchemicalNetwork between updates. The default
+        implementation recomputes the full proposal on every update.
+
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+            The AlchemicalNetwork containing the Transformations.
+        protocol_results: dict[GufeKey, ProtocolResult]
+            A dictionary of Transformation GufeKeys paired with the
+            Transformation's ProtocolResults.
+
+        Returns
+        -------
+        IncrementalProposal
+
         """
-        subgraphs = alchemical_network.connected_subgraphs()
-        acc = StrategyResult({})
-        for subgraph in subgraphs:
-            acc |= self._propose(subgraph, protocol_results)
-        return acc
+        return RecomputedProposal(self, alchemical_network, protocol_results)
@@ -0,0 +1,139 @@
+"""Instrumentation of ``Strategy.propose`` calls.
+
+Tracing is enabled by entering a ``ProposeTracer``::
+
+    with ProposeTracer() as tracer:
+        strategy.propose(alchemical_network, protocol_results)
+
+    for record in tracer.records:
+        print(record.phases, record.n_components)
+
+Every ``propose`` call made while the tracer is active produces a
+``ProposeRecord`` with the wall time spent in each phase of the
+proposal. Strategies can time their own phases with :func:`phase`.
+When no tracer is active, ``propose`` skips all bookkeeping.
+"""
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, ContextManager, Iterator
+
+from gufe import AlchemicalNetwork
+from gufe.tokenization import GufeKey
+
+if TYPE_CHECKING:
+    from .strategy import Strategy
+
+_active_tracer: ContextVar["ProposeTracer | None"] = ContextVar(
+    "_active_tracer", default=None
+)
+_active_record: ContextVar["ProposeRecord | None"] = ContextVar(
+    "_active_record", default=None
+)
+
+_null_phase = nullcontext()
+
+
+@dataclass
+class ProposeRecord:
+    """Measurements of a single ``Strategy.propose`` call.
+
+    Attributes
+    ----------
+    strategy: str
+        The name of the Strategy class.
+    network_key: GufeKey
+        The GufeKey of the proposed AlchemicalNetwork.
+    phases: dict[str, float]
+        The wall time in seconds spent in each phase. Phases can be
+        nested, e.g. ``"eccentricity"`` is part of ``"propose"``.
+    wall_time: float
+        The total wall time of the call in seconds.
+    n_components: int
+        The number of connected subgraphs proposed.
+    n_edges: int
+        The number of Transformations visited.
+    n_weights: int
+        The number of weights in the returned StrategyResult.
+    """
+
+    strategy: str
+    network_key: GufeKey
+    phases: dict[str, float] = field(default_factory=dict)
+    wall_time: float = 0.0
+    n_components: int = 0
+    n_edges: int = 0
+    n_weights: int = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall time spent in the block to the ``name`` phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+
+class ProposeTracer:
+    """Collect a ``ProposeRecord`` for every ``Strategy.propose``
+    call made within the tracer's context.
+
+    Parameters
+    ----------
+    callback: Callable[[ProposeRecord], None] | None
+        An optional function called with each record as soon as its
+        ``propose`` call finishes.
+    """
+
+    def __init__(self, callback: Callable[[ProposeRecord], None] | None = None):
+        self.records: list[ProposeRecord] = []
+        self._callback = callback
+        self._tokens = []
+
+    def __enter__(self) -> "ProposeTracer":
+        self._tokens.append(_active_tracer.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active_tracer.reset(self._tokens.pop())
+
+    @contextmanager
+    def record(
+        self, strategy: "Strategy", alchemical_network: AlchemicalNetwork
+    ) -> Iterator[ProposeRecord]:
+        """Measure a ``propose`` call of ``strategy``."""
+        record = ProposeRecord(
+            strategy=type(strategy).__qualname__,
+            network_key=alchemical_network.key,
+        )
+        token = _active_record.set(record)
+        start = perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_time = perf_counter() - start
+            _active_record.reset(token)
+
+        self.records.append(record)
+        if self._callback is not None:
+            self._callback(record)
+
+
+def current_tracer() -> ProposeTracer | None:
+    """Get the active ``ProposeTracer``, if any."""
+    return _active_tracer.get()
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Time a block as the ``name`` phase of the active proposal.
+
+    This does nothing when tracing is disabled, or when called from a
+    thread other than the one that called ``propose``.
+    """
+    record = _active_record.get()
+    if record is None:
+        return _null_phase
+    return record.phase(name)
@@ -0,0 +1,2 @@
+from .eccentricity import eccentricities, network_eccentricity
+from .index import NetworkIndex
@@ -0,0 +1,217 @@
+r"""Exact vertex eccentricities using eccentricity bounds.
+
+The eccentricity of every vertex is determined with the bounding
+algorithm of Takes and Kosters [1]_. A breadth-first search (BFS) from
+a vertex ``v`` with eccentricity ``e(v)`` bounds the eccentricity of
+every other vertex ``w`` in the same component:
+
+.. math::
+
+    \max(d(v, w), e(v) - d(v, w)) \le e(w) \le e(v) + d(v, w)
+
+Vertices whose bounds meet are resolved without running their own
+BFS. Alternating the BFS source between the vertex with the largest
+upper bound and the vertex with the smallest lower bound resolves
+most vertices of sparse, tree-like networks, such as star maps and
+radial networks, after only a handful of searches.
+
+The search can also be stopped early, after a fixed number of BFS
+sweeps or once the bounds of every vertex are close enough, in which
+case the lower bounds are returned as approximate eccentricities.
+
+.. [1] F. W. Takes and W. A. Kosters, "Computing the Eccentricity
+   Distribution of a Large Graph", Algorithms 6, 100-118 (2013).
+"""
+
+from collections import deque
+from random import Random
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+from gufe import AlchemicalNetwork, ChemicalSystem
+
+
+def _bfs(adjacency: Sequence[Sequence[int]], source: int, distances: list[int]):
+    """Fill ``distances`` with the BFS distances from ``source``.
+
+    Returns the vertices reached, in BFS order.
+    """
+    distances[source] = 0
+    reached = [source]
+    queue = deque(reached)
+    while queue:
+        vertex = queue.popleft()
+        next_distance = distances[vertex] + 1
+        for neighbor in adjacency[vertex]:
+            if distances[neighbor] < 0:
+                distances[neighbor] = next_distance
+                reached.append(neighbor)
+                queue.append(neighbor)
+    return reached
+
+
+def eccentricities(
+    adjacency: Sequence[Sequence[int]],
+    max_sweeps: int | None = None,
+    tolerance: int = 0,
+    seed: int | None = None,
+) -> list[int]:
+    """Compute the eccentricity of every vertex of an undirected graph.
+
+    Eccentricities are computed within each connected component, so
+    a disconnected graph yields the eccentricities of each of its
+    components.
+
+    By default, the eccentricities are exact. Limiting the number of
+    BFS sweeps per component with ``max_sweeps``, or accepting a gap
+    of up to ``tolerance`` between the bounds of a vertex, returns
+    lower bounds of the eccentricities instead. These are never larger
+    than the exact eccentricities, and the cost of a component is at
+    most ``max_sweeps`` searches of it.
+
+    Parameters
+    ----------
+    adjacency: Sequence[Sequence[int]]
+        The neighbors of every vertex, where vertices are labeled
+        ``0`` to ``len(adjacency) - 1``. Every edge must be listed for
+        both of its vertices. Repeated neighbors are allowed.
+    max_sweeps: int | None
+        The maximum number of BFS sweeps per component, unlimited if
+        ``None``.
+    tolerance: int
+        The largest accepted difference between the upper and lower
+        bound of a vertex's eccentricity.
+    seed: int | None
+        If given, the first BFS of each component starts from a vertex
+        chosen at random with this seed, rather than from the vertex
+        with the lowest label.
+
+    Returns
+    -------
+    list[int]
+        The eccentricity, or its lower bound, of each vertex.
+    """
+    n_vertices = len(adjacency)
+    result = [-1] * n_vertices
+    distances = [-1] * n_vertices
+
+    starts = range(n_vertices)
+    if seed is not None:
+        # the first unresolved vertex of a random order is a random
+        # vertex of its component
+        starts = Random(seed).sample(starts, n_vertices)
+
+    for start in starts:
+        if result[start] >= 0:
+            continue
+
+        # the initial BFS identifies the component and provides the
+        # first set of bounds
+        component = _bfs(adjacency, start, distances)
+        _resolve_component(
+            adjacency, component, distances, result, max_sweeps, tolerance
+        )
+
+    return result
+
+
+def _resolve_component(
+    adjacency: Sequence[Sequence[int]],
+    component: list[int],
+    distances: list[int],
+    result: list[int],
+    max_sweeps: int | None = None,
+    tolerance: int = 0,
+):
+    if len(component) == 1:
+        result[component[0]] = 0
+        distances[component[0]] = -1
+        return
+
+    # every leaf shares the eccentricity of all other leaves attached
+    # to the same vertex, only one of them has to be resolved
+    representative: dict[int, int] = {}
+    pruned: dict[int, int] = {}
+    for vertex in component:
+        neighbors = set(adjacency[vertex])
+        neighbors.discard(vertex)
+        if len(neighbors) == 1:
+            (anchor,) = neighbors
+            if anchor in representative:
+                pruned[vertex] = representative[anchor]
+            else:
+                representative[anchor] = vertex
+
+    candidates = {vertex for vertex in component if vertex not in pruned}
+    lower = {vertex: 0 for vertex in candidates}
+    upper = {vertex: len(component) for vertex in candidates}
+    degree = {vertex: len(adjacency[vertex]) for vertex in candidates}
+
+    choose_upper = True
+    n_sweeps = 1
+    while True:
+        source_eccentricity = max(distances[vertex] for vertex in component)
+
+        for vertex in list(candidates):
+            distance = distances[vertex]
+            low = max(lower[vertex], distance, source_eccentricity - distance)
+            high = min(upper[vertex], source_eccentricity + distance)
+            if high - low <= tolerance:
+                result[vertex] = low
+                candidates.remove(vertex)
+            else:
+                lower[vertex] = low
+                upper[vertex] = high
+
+        for vertex in component:
+            distances[vertex] = -1
+
+        if not candidates:
+            break
+
+        if max_sweeps is not None and n_sweeps >= max_sweeps:
+            for vertex in candidates:
+                result[vertex] = lower[vertex]
+            break
+
+        if choose_upper:
+            source = max(candidates, key=lambda v: (upper[v], degree[v], -v))
+        else:
+            source = min(candidates, key=lambda v: (lower[v], -degree[v], v))
+        choose_upper = not choose_upper
+
+        _bfs(adjacency, source, distances)
+        n_sweeps += 1
+
+    for vertex, leaf in pruned.items():
+        result[vertex] = result[leaf]
+
+
+def network_eccentricity(
+    alchemical_network: AlchemicalNetwork,
+) -> Mapping[ChemicalSystem, int]:
+    """Get the eccentricity of every ChemicalSystem in an
+    AlchemicalNetwork.
+
+    Transformations are treated as undirected edges. The
+    eccentricities are those cached with the network's
+    :class:`~stratocaster.network.NetworkIndex`, so repeated calls for
+    the same network do not recompute them.
+
+    Parameters
+    ----------
+    alchemical_network: AlchemicalNetwork
+
+    Returns
+    -------
+    Mapping[ChemicalSystem, int]
+        A read-only mapping of each ChemicalSystem to its eccentricity
+        within its connected component.
+    """
+    # avoid a circular import, the index depends on this module
+    from .index import NetworkIndex
+
+    network_index = NetworkIndex.from_network(alchemical_network)
+    return MappingProxyType(
+        dict(zip(network_index.nodes, network_index.eccentricity.tolist()))
+    )
@@ -0,0 +1,287 @@
+from collections import deque
+from typing import Mapping
+
+import numpy as np
+from gufe import AlchemicalNetwork, ChemicalSystem
+from gufe.tokenization import GufeKey
+
+from stratocaster.base.arrays import KeyTable
+from stratocaster.base.cache import KeyedCache
+from stratocaster.base.counts import ResultSummary, result_count
+
+from .eccentricity import eccentricities
+
+_index_cache: KeyedCache["NetworkIndex"] = KeyedCache(maxsize=256)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class NetworkIndex:
+    """An immutable, array-based compilation of an AlchemicalNetwork.
+
+    ChemicalSystems are labeled ``0`` to ``n_nodes - 1`` and
+    Transformations ``0`` to ``n_edges - 1``. All per-node and per-edge
+    quantities are stored in read-only NumPy arrays using these labels.
+    Transformations are treated as undirected edges for adjacency,
+    degrees, connected components and eccentricities.
+
+    Use :meth:`from_network` to get the index of a network, which is
+    built once per network ``GufeKey`` and shared by all strategies.
+
+    Attributes
+    ----------
+    nodes: tuple[ChemicalSystem, ...]
+        The ChemicalSystems of the network, in label order.
+    edge_keys: KeyTable
+        The Transformation GufeKeys, in label order.
+    edge_source: np.ndarray
+        The stateA node label of each Transformation.
+    edge_target: np.ndarray
+        The stateB node label of each Transformation.
+    degree: np.ndarray
+        The number of Transformations each node takes part in.
+    indptr: np.ndarray
+        CSR row pointers of the undirected adjacency.
+    indices: np.ndarray
+        CSR neighbor labels of the undirected adjacency. Neighbors
+        connected by several Transformations are repeated.
+    component_labels: np.ndarray
+        The connected component label of each node.
+    n_components: int
+        The number of connected components.
+    components: tuple[NetworkIndex, ...]
+        An index of each connected component, built on first access.
+    """
+
+    def __init__(
+        self,
+        nodes: tuple[ChemicalSystem, ...],
+        edge_keys: KeyTable,
+        edge_source: np.ndarray,
+        edge_target: np.ndarray,
+    ):
+        n_nodes = len(nodes)
+
+        self.nodes = nodes
+        self.edge_keys = edge_keys
+        self.edge_source = _read_only(np.asarray(edge_source, dtype=np.intp))
+        self.edge_target = _read_only(np.asarray(edge_target, dtype=np.intp))
+
+        self.degree = _read_only(
+            np.bincount(self.edge_source, minlength=n_nodes)
+            + np.bincount(self.edge_target, minlength=n_nodes)
+        )
+
+        # each edge appears once for both of its ends
+        ends = np.concatenate([self.edge_source, self.edge_target])
+        neighbors = np.concatenate([self.edge_target, self.edge_source])
+        order = np.argsort(ends, kind="stable")
+        indptr = np.zeros(n_nodes + 1, dtype=np.intp)
+        np.cumsum(np.bincount(ends, minlength=n_nodes), out=indptr[1:])
+        self.indptr = _read_only(indptr)
+        self.indices = _read_only(neighbors[order])
+
+        indices = self.indices.tolist()
+        self._adjacency: list[list[int]] = [
+            indices[start:stop]
+            for start, stop in zip(indptr[:-1].tolist(), indptr[1:].tolist())
+        ]
+
+        self.component_labels, self.n_components = self._label_components()
+        self._eccentricity: np.ndarray | None = None
+        self._approximate_eccentricity: dict[tuple, np.ndarray] = {}
+        self._components: tuple["NetworkIndex", ...] | None = None
+
+    def _label_components(self) -> tuple[np.ndarray, int]:
+        adjacency = self._adjacency
+        labels = [-1] * len(adjacency)
+        n_components = 0
+        for start in range(len(adjacency)):
+            if labels[start] >= 0:
+                continue
+            labels[start] = n_components
+            queue = deque([start])
+            while queue:
+                for neighbor in adjacency[queue.popleft()]:
+                    if labels[neighbor] < 0:
+                        labels[neighbor] = n_components
+                        queue.append(neighbor)
+            n_components += 1
+        return _read_only(np.array(labels, dtype=np.intp)), n_components
+
+    @classmethod
+    def from_network(cls, alchemical_network: AlchemicalNetwork) -> "NetworkIndex":
+        """Get the index of an AlchemicalNetwork.
+
+        The index is cached under the GufeKey of the network, so it is
+        built only once for any number of proposals and strategies.
+
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+
+        Returns
+        -------
+        NetworkIndex
+        """
+
+        def build():
+            graph = alchemical_network.graph
+            nodes = tuple(graph.nodes)
+            node_labels = {node: label for label, node in enumerate(nodes)}
+
+            edge_keys = []
+            edge_source = []
+            edge_target = []
+            for state_a, state_b, transformation in graph.edges(data="object"):
+                edge_keys.append(transformation.key)
+                edge_source.append(node_labels[state_a])
+                edge_target.append(node_labels[state_b])
+
+            return cls(nodes, KeyTable(edge_keys), edge_source, edge_target)
+
+        return _index_cache.get_or_compute(alchemical_network.key, build)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edge_keys)
+
+    @property
+    def adjacency(self) -> list[list[int]]:
+        """The neighbor labels of every node as Python lists."""
+        return self._adjacency
+
+    @property
+    def eccentricity(self) -> np.ndarray:
+        """The eccentricity of every node within its connected
+        component, computed on first access."""
+        if self._eccentricity is None:
+            self._eccentricity = _read_only(
+                np.array(eccentricities(self._adjacency), dtype=np.intp)
+            )
+        return self._eccentricity
+
+    def approximate_eccentricity(
+        self, max_sweeps: int, tolerance: int = 0, seed: int | None = 0
+    ) -> np.ndarray:
+        """Lower bounds of the eccentricity of every node within its
+        connected component, from at most ``max_sweeps`` BFS sweeps per
+        component.
+
+        The bounds are cached for each combination of parameters. See
+        :func:`~stratocaster.network.eccentricities` for details.
+
+        Parameters
+        ----------
+        max_sweeps: int
+            The maximum number of BFS sweeps per component.
+        tolerance: int
+            The largest accepted difference between the upper and lower
+            bound of a node's eccentricity.
+        seed: int | None
+            The seed choosing the first BFS source of each component.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        parameters = (max_sweeps, tolerance, seed)
+        if parameters not in self._approximate_eccentricity:
+            self._approximate_eccentricity[parameters] = _read_only(
+                np.array(
+                    eccentricities(
+                        self._adjacency,
+                        max_sweeps=max_sweeps,
+                        tolerance=tolerance,
+                        seed=seed,
+                    ),
+                    dtype=np.intp,
+                )
+            )
+        return self._approximate_eccentricity[parameters]
+
+    @property
+    def components(self) -> tuple["NetworkIndex", ...]:
+        """An index of each connected component, in label order.
+
+        The components are split from this index on first access and
+        cached with it, so they are built once per network rather than
+        on every proposal. A connected network is its own only
+        component.
+        """
+        if self._components is None:
+            self._components = self._split_components()
+        return self._components
+
+    def _split_components(self) -> tuple["NetworkIndex", ...]:
+        if self.n_components == 1:
+            return (self,)
+
+        component_range = np.arange(self.n_components + 1)
+
+        # group the nodes and edges of each component together
+        node_order = np.argsort(self.component_labels, kind="stable")
+        node_bounds = np.searchsorted(
+            self.component_labels[node_order], component_range
+        ).tolist()
+        edge_labels = self.component_labels[self.edge_source]
+        edge_order = np.argsort(edge_labels, kind="stable")
+        edge_bounds = np.searchsorted(edge_labels[edge_order], component_range).tolist()
+
+        # the label of every node within its own component
+        local_labels = np.empty(self.n_nodes, dtype=np.intp)
+        edge_keys = self.edge_keys.keys
+
+        components = []
+        for component in range(self.n_components):
+            component_nodes = node_order[
+                node_bounds[component] : node_bounds[component + 1]
+            ]
+            component_edges = edge_order[
+                edge_bounds[component] : edge_bounds[component + 1]
+            ]
+            local_labels[component_nodes] = np.arange(len(component_nodes))
+
+            component_index = NetworkIndex(
+                tuple(self.nodes[node] for node in component_nodes.tolist()),
+                KeyTable(edge_keys[edge] for edge in component_edges.tolist()),
+                local_labels[self.edge_source[component_edges]],
+                local_labels[self.edge_target[component_edges]],
+            )
+            if self._eccentricity is not None:
+                component_index._eccentricity = _read_only(
+                    self._eccentricity[component_nodes]
+                )
+            components.append(component_index)
+
+        return tuple(components)
+
+    def counts(
+        self, protocol_results: Mapping[GufeKey, ResultSummary | int]
+    ) -> np.ndarray:
+        """Get the number of ProtocolDAGResults of every Transformation.
+
+        Parameters
+        ----------
+        protocol_results: Mapping[GufeKey, ResultSummary | int]
+            ProtocolResults, ``ResultSummary`` objects or counts keyed
+            by Transformation GufeKey. Missing Transformations have a
+            count of zero.
+
+        Returns
+        -------
+        np.ndarray
+            The counts, aligned with ``edge_keys``.
+        """
+        return np.fromiter(
+            (result_count(protocol_results.get(key)) for key in self.edge_keys),
+            dtype=np.int64,
+            count=self.n_edges,
+        )
@@ -0,0 +1,138 @@
+"""Discovery of Strategy classes through package entry points.
+
+Packages make their strategies available by name with an entry point
+in the ``stratocaster.strategies`` group, for example in their
+``pyproject.toml``::
+
+    [project.entry-points."stratocaster.strategies"]
+    mystrategy = "mypackage.strategies:MyStrategy"
+
+Entry points are discovered on first use, and the module defining a
+strategy is only imported once that strategy is requested by name, so
+unused plugins cost nothing at startup.
+"""
+
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from stratocaster.base import Strategy
+
+ENTRY_POINT_GROUP = "stratocaster.strategies"
+
+
+@cache
+def _strategy_entry_points() -> dict[str, EntryPoint]:
+    return {
+        entry_point.name: entry_point
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP)
+    }
+
+
+def available_strategies() -> list[str]:
+    """Get the names of all registered strategies.
+
+    No strategy modules are imported, so strategies whose optional
+    dependencies are missing, such as ``"uncertainty"`` without SciPy,
+    are still listed.
+
+    Returns
+    -------
+    list[str]
+    """
+    return sorted(_strategy_entry_points())
+
+
+@cache
+def get_strategy_class(name: str) -> type["Strategy"]:
+    """Get a registered Strategy class by name, importing its module.
+
+    Parameters
+    ----------
+    name: str
+        The entry point name of the strategy, e.g. ``"connectivity"``.
+
+    Returns
+    -------
+    type[Strategy]
+
+    Raises
+    ------
+    ValueError
+        If no strategy is registered under ``name``.
+    TypeError
+        If the entry point does not refer to a Strategy subclass.
+    """
+    try:
+        entry_point = _strategy_entry_points()[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy {name!r}, expected one of {available_strategies()}"
+        ) from None
+
+    from stratocaster.base import Strategy
+
+    strategy_class = entry_point.load()
+    if not (isinstance(strategy_class, type) and issubclass(strategy_class, Strategy)):
+        raise TypeError(
+            f"Entry point {entry_point.value!r} of strategy {name!r} is not a Strategy subclass"
+        )
+    return strategy_class
+
+
+def strategy_from_config(config: Mapping[str, Any]) -> "Strategy":
+    """Create a Strategy from a plain configuration mapping.
+
+    The ``"strategy"`` entry names a registered strategy and the
+    optional ``"settings"`` entry holds the fields of its settings,
+    which default to the strategy's default settings. Any other
+    entries are passed to the strategy as keyword arguments, with the
+    configurations in a ``"strategies"`` list created recursively::
+
+        strategy_from_config(
+            {
+                "strategy": "composite",
+                "settings": {"blend": "product"},
+                "strategies": [
+                    {"strategy": "connectivity", "settings": {"max_runs": 5}},
+                    {"strategy": "radialgrowth"},
+                ],
+            }
+        )
+
+    Parameters
+    ----------
+    config: Mapping[str, Any]
+
+    Returns
+    -------
+    Strategy
+
+    Raises
+    ------
+    ValueError
+        If the configuration does not name a registered strategy.
+    """
+    match config:
+        case {"strategy": str(name), **options}:
+            pass
+        case _:
+            raise ValueError("A strategy configuration must have a `strategy` name")
+
+    strategy_class = get_strategy_class(name)
+
+    match options.pop("settings", None):
+        case None:
+            settings = strategy_class.default_settings()
+        case dict(fields):
+            settings = strategy_class._settings_cls(**fields)
+        case settings:
+            pass
+
+    if "strategies" in options:
+        options["strategies"] = [
+            strategy_from_config(child) for child in options["strategies"]
+        ]
+
+    return strategy_class(settings, **options)
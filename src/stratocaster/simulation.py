@@ -0,0 +1,204 @@
+"""Offline simulation of the propose and run loop of a Strategy.
+
+A simulation repeatedly proposes weights for an AlchemicalNetwork,
+selects Transformations to run with a policy, and counts one new
+ProtocolDAGResult for each selected Transformation::
+
+    result = simulate(strategy, alchemical_network, policy="weighted", seed=0)
+    print(result.terminated, result.total_runs)
+
+No ProtocolResults are created. The Strategy is given plain counts and
+is updated through :meth:`~stratocaster.base.strategy.Strategy.incremental`,
+so only strategies whose weights depend on result counts alone can be
+simulated faithfully.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+from gufe import AlchemicalNetwork
+from gufe.tokenization import GufeKey
+
+from stratocaster.base import ArrayStrategyResult, KeyTable, Strategy
+from stratocaster.network import NetworkIndex
+
+Policy = Callable[[ArrayStrategyResult, int, np.random.Generator], Iterable[GufeKey]]
+
+
+def weighted_policy(
+    proposal: ArrayStrategyResult, batch_size: int, rng: np.random.Generator
+) -> list[GufeKey]:
+    """Draw ``batch_size`` Transformations with replacement, with
+    probability proportional to their weights."""
+    return proposal.sample(batch_size, replace=True, seed=rng)
+
+
+def top_k_policy(
+    proposal: ArrayStrategyResult, batch_size: int, rng: np.random.Generator
+) -> list[GufeKey]:
+    """Select the ``batch_size`` Transformations with the largest
+    positive weights."""
+    return [key for key, weight in proposal.top_k(batch_size) if weight > 0]
+
+
+def uniform_policy(
+    proposal: ArrayStrategyResult, batch_size: int, rng: np.random.Generator
+) -> list[GufeKey]:
+    """Select up to ``batch_size`` distinct Transformations with a
+    positive weight, uniformly at random."""
+    (candidates,) = np.nonzero(proposal.weights > 0)
+    selected = rng.choice(
+        candidates, size=min(batch_size, len(candidates)), replace=False
+    )
+    return [proposal.key_table[position] for position in selected]
+
+
+policies: dict[str, Policy] = {
+    "weighted": weighted_policy,
+    "top_k": top_k_policy,
+    "uniform": uniform_policy,
+}
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """The outcome of :func:`simulate`.
+
+    Attributes
+    ----------
+    key_table: KeyTable
+        The Transformation keys, in the order of the columns of
+        ``weights`` and the entries of ``counts``.
+    weights: numpy.ndarray
+        The proposed weights before each iteration, one row per
+        iteration, with ``None`` weights stored as NaN. Empty if the
+        weights were not recorded.
+    counts: numpy.ndarray
+        The final number of results of each Transformation, including
+        any initial counts.
+    n_iterations: int
+        The number of iterations in which Transformations were run.
+    total_runs: int
+        The number of results added by the simulation.
+    terminated: bool
+        Whether the simulation stopped because no Transformation had a
+        positive weight, rather than by reaching ``max_iterations``.
+    """
+
+    key_table: KeyTable
+    weights: np.ndarray
+    counts: np.ndarray
+    n_iterations: int
+    total_runs: int
+    terminated: bool
+
+
+def simulate(
+    strategy: Strategy,
+    alchemical_network: AlchemicalNetwork,
+    policy: str | Policy = "weighted",
+    batch_size: int = 1,
+    max_iterations: int = 1000,
+    seed: int | np.random.Generator | None = None,
+    *,
+    initial_counts: dict[GufeKey, int] | None = None,
+    record_weights: bool = True,
+) -> SimulationResult:
+    """Simulate running a Strategy on an AlchemicalNetwork until it
+    stops proposing Transformations.
+
+    In every iteration, the policy selects Transformations from the
+    current proposal and each selection adds one result to the count
+    of its Transformation. A Transformation selected more than once
+    in an iteration gains one result per selection.
+
+    Parameters
+    ----------
+    strategy: Strategy
+        The Strategy to simulate.
+    alchemical_network: AlchemicalNetwork
+        The AlchemicalNetwork containing the Transformations.
+    policy: str | Policy
+        Either the name of a built-in policy, ``"weighted"``,
+        ``"top_k"`` or ``"uniform"``, or a callable taking the current
+        proposal, ``batch_size`` and a ``numpy.random.Generator`` and
+        returning the keys of the Transformations to run.
+    batch_size: int
+        The number of Transformations selected in every iteration.
+    max_iterations: int
+        The maximum number of iterations to simulate.
+    seed: int | numpy.random.Generator | None
+        A seed or generator passed to ``numpy.random.default_rng``.
+    initial_counts: dict[GufeKey, int] | None
+        The number of results each Transformation starts with.
+    record_weights: bool
+        Whether to record the proposed weights of every iteration.
+
+    Returns
+    -------
+    SimulationResult
+
+    Raises
+    ------
+    ValueError
+        If the policy is not known or ``batch_size`` is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("`batch_size` must be at least 1")
+
+    match policy:
+        case str():
+            try:
+                select = policies[policy]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown policy {policy!r}, expected one of {sorted(policies)}"
+                ) from None
+        case _:
+            select = policy
+
+    rng = np.random.default_rng(seed)
+    key_table = NetworkIndex.from_network(alchemical_network).edge_keys
+
+    counts = np.zeros(len(key_table), dtype=np.int64)
+    if initial_counts:
+        counts[key_table.positions(initial_counts)] = list(initial_counts.values())
+
+    proposal = strategy.incremental(
+        alchemical_network,
+        {key: int(count) for key, count in zip(key_table, counts)},
+    )
+
+    recorded = []
+    terminated = False
+    n_iterations = 0
+    while n_iterations < max_iterations:
+        weights = proposal.result.to_array(key_table)
+        if record_weights:
+            recorded.append(weights.weights)
+
+        if not (weights.weights > 0).any():
+            terminated = True
+            break
+
+        selected = key_table.positions(select(weights, batch_size, rng))
+        if not len(selected):
+            terminated = True
+            break
+
+        np.add.at(counts, selected, 1)
+        proposal.update(
+            {key_table[position]: int(counts[position]) for position in selected}
+        )
+        n_iterations += 1
+
+    total_runs = int(counts.sum()) - sum((initial_counts or {}).values())
+    return SimulationResult(
+        key_table=key_table,
+        weights=(np.vstack(recorded) if recorded else np.empty((0, len(key_table)))),
+        counts=counts,
+        n_iterations=n_iterations,
+        total_runs=total_runs,
+        terminated=terminated,
+    )
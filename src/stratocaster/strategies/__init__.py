@@ -1,4 +1,45 @@
-from stratocaster.strategies.connectivity import ConnectivityStrategy
-from stratocaster.strategies.radialgrowth import RadialGrowthStrategy
+"""Strategy implementations.
 
-__all__ = ["ConnectivityStrategy", "RadialGrowthStrategy"]
+The strategy classes are imported on first access, so importing this
+package does not import gufe, pydantic or NumPy until a strategy is
+actually used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from stratocaster.strategies.composite import CompositeStrategy
+    from stratocaster.strategies.connectivity import ConnectivityStrategy
+    from stratocaster.strategies.radialgrowth import RadialGrowthStrategy
+    from stratocaster.strategies.uncertainty import UncertaintyStrategy
+
+__all__ = [
+    "CompositeStrategy",
+    "ConnectivityStrategy",
+    "RadialGrowthStrategy",
+    "UncertaintyStrategy",
+]
+
+_strategy_modules = {
+    "CompositeStrategy": "stratocaster.strategies.composite",
+    "ConnectivityStrategy": "stratocaster.strategies.connectivity",
+    "RadialGrowthStrategy": "stratocaster.strategies.radialgrowth",
+    "UncertaintyStrategy": "stratocaster.strategies.uncertainty",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _strategy_modules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    strategy_class = getattr(import_module(module), name)
+    # later lookups no longer reach __getattr__
+    globals()[name] = strategy_class
+    return strategy_class
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
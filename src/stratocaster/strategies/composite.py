@@ -0,0 +1,219 @@
+from typing import Literal
+
+import numpy as np
+from gufe import AlchemicalNetwork, ProtocolResult
+from gufe.tokenization import GufeKey
+from pydantic import Field, field_validator
+
+from stratocaster.base import ArrayStrategyResult, Strategy, StrategyResult
+from stratocaster.base.counts import ResultSummary
+from stratocaster.base.models import StrategySettings
+from stratocaster.network import NetworkIndex
+
+
+class CompositeStrategySettings(StrategySettings):
+    """Settings required for the CompositeStrategy."""
+
+    blend: Literal["sum", "product", "max"] = Field(
+        default="sum",
+        description="how the weights of the child strategies are combined",
+    )
+
+    blend_weights: list[float] | None = Field(
+        default=None,
+        description="the relative weight of each child strategy, all equal if not set",
+    )
+
+    @field_validator("blend_weights", mode="before")
+    def validate_blend_weights(cls, value):
+        if value is not None:
+            if not all(weight >= 0 for weight in value):
+                raise ValueError("`blend_weights` must be greater than or equal to 0")
+        return value
+
+
+class CompositeStrategy(Strategy):
+    r"""A Strategy that blends the weights of several child strategies.
+
+    All children propose weights for the same connected subgraph and
+    share its :class:`~stratocaster.network.NetworkIndex`, so the
+    network is split and compiled only once. The result counts of the
+    children whose weights only depend on counts are also resolved
+    once. With child weights :math:`x_i` and blend weights :math:`w_i`,
+    the blended weight of a Transformation is
+
+    * ``"sum"``: :math:`\sum_i w_i x_i`
+    * ``"product"``: :math:`\prod_i x_i^{w_i}`
+    * ``"max"``: :math:`\max_i w_i x_i`
+
+    A ``None`` child weight is left out of a sum or maximum, and the
+    blended weight is only ``None`` once every child weight is
+    ``None``. For a product, any ``None`` child weight makes the
+    blended weight ``None``. Child weights are not normalized before
+    blending, so ``blend_weights`` can be used to balance children
+    with weights of different magnitudes.
+
+    Unlike other strategies, a CompositeStrategy cannot be created from
+    its settings alone, as in ``cls(cls.default_settings())``, since the
+    child strategies are not part of the settings. With
+    :func:`~stratocaster.registry.strategy_from_config`, they are given
+    as a ``"strategies"`` list of configurations.
+
+    Parameters
+    ----------
+    settings: CompositeStrategySettings
+    strategies: list[Strategy]
+        The child strategies.
+    """
+
+    _settings_cls = CompositeStrategySettings
+
+    def __init__(self, settings: CompositeStrategySettings, strategies: list[Strategy]):
+        if not strategies:
+            raise ValueError("`strategies` must contain at least one Strategy")
+
+        if (
+            isinstance(settings, CompositeStrategySettings)
+            and settings.blend_weights is not None
+            and len(settings.blend_weights) != len(strategies)
+        ):
+            raise ValueError(
+                f"Expected {len(strategies)} `blend_weights`, got {len(settings.blend_weights)}"
+            )
+
+        self._strategies = tuple(strategies)
+        super().__init__(settings)
+
+    @property
+    def strategies(self) -> tuple[Strategy, ...]:
+        return self._strategies
+
+    def _to_dict(self) -> dict:
+        return {"settings": self._settings, "strategies": list(self._strategies)}
+
+    @classmethod
+    def _default_settings(cls) -> StrategySettings:
+        return CompositeStrategySettings()
+
+    @property
+    def _indexed(self) -> bool:
+        # the children can only share an index if all of them use it
+        return super()._indexed and all(
+            strategy._indexed for strategy in self._strategies
+        )
+
+    def _propose(
+        self,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> StrategyResult:
+        """Propose `Transformation` weights by blending the proposals of
+        the child strategies.
+
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int]
+            A dictionary whose keys are the `GufeKey`s of `Transformation`s in the `AlchemicalNetwork`
+            and whose values are the `ProtocolResult`s, `ResultSummary`s or ProtocolDAGResult counts
+            for those `Transformation`s.
+
+        Returns
+        -------
+        StrategyResult
+            A `StrategyResult` containing the proposed `Transformation` weights.
+        """
+        network_index = NetworkIndex.from_network(alchemical_network)
+        return self._blend(
+            network_index,
+            self._propose_children(network_index, protocol_results, alchemical_network),
+        )
+
+    def _propose_index(
+        self,
+        network_index: NetworkIndex,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> StrategyResult:
+        # only used when every child proposes through its index
+        return self._blend(
+            network_index, self._propose_children(network_index, protocol_results)
+        )
+
+    @property
+    def _counted(self) -> bool:
+        return super()._counted and all(
+            strategy._counted for strategy in self._strategies
+        )
+
+    def _propose_counts(
+        self,
+        network_index: NetworkIndex,
+        counts: np.ndarray,
+    ) -> StrategyResult:
+        # only used when every child proposes from counts
+        return self._blend(
+            network_index,
+            [
+                strategy._propose_counts(network_index, counts)
+                for strategy in self._strategies
+            ],
+        )
+
+    def _propose_children(
+        self,
+        network_index: NetworkIndex,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+        alchemical_network: AlchemicalNetwork | None = None,
+    ) -> list[StrategyResult]:
+        """Propose with every child, resolving the result counts of the
+        children that only depend on counts once."""
+        counts = None
+        results = []
+        for strategy in self._strategies:
+            if strategy._counted:
+                if counts is None:
+                    counts = network_index.counts(protocol_results)
+                results.append(strategy._propose_counts(network_index, counts))
+            elif strategy._indexed:
+                results.append(strategy._propose_index(network_index, protocol_results))
+            else:
+                results.append(strategy._propose(alchemical_network, protocol_results))
+        return results
+
+    def _blend(
+        self, network_index: NetworkIndex, results: list[StrategyResult]
+    ) -> StrategyResult:
+        settings = self.settings
+
+        # keep the type checker happy
+        assert isinstance(settings, CompositeStrategySettings)
+
+        blend_weights = np.array(
+            settings.blend_weights or [1.0] * len(results), dtype=np.float64
+        )[:, np.newaxis]
+
+        # one row of weights per child, aligned with the edge keys
+        child_weights = np.vstack(
+            [result.to_array(network_index.edge_keys).weights for result in results]
+        )
+        is_none = np.isnan(child_weights)
+
+        match settings.blend:
+            case "sum":
+                blended = np.where(is_none, 0.0, blend_weights * child_weights).sum(
+                    axis=0
+                )
+                terminated = is_none.all(axis=0)
+            case "product":
+                blended = (child_weights**blend_weights).prod(axis=0)
+                terminated = is_none.any(axis=0)
+            case "max":
+                blended = np.where(is_none, -np.inf, blend_weights * child_weights).max(
+                    axis=0
+                )
+                terminated = is_none.all(axis=0)
+
+        blended[terminated] = np.nan
+        return ArrayStrategyResult(
+            network_index.edge_keys, blended
+        ).to_strategy_result()
@@ -1,8 +1,16 @@
+import numpy as np
 from gufe import AlchemicalNetwork, ProtocolResult
 from gufe.tokenization import GufeKey
 
-from stratocaster.base import Strategy, StrategyResult
+from stratocaster.base import (
+    ArrayStrategyResult,
+    Strategy,
+    StrategyResult,
+    VersionedProposal,
+)
+from stratocaster.base.counts import ResultSummary, result_count
 from stratocaster.base.models import StrategySettings
+from stratocaster.network import NetworkIndex
 
 from pydantic import (
     Field,
@@ -87,19 +95,107 @@ class ConnectivityStrategy(Strategy):
         """
         return decay_rate**number_of_results
 
+    def _transformation_weight(
+        self, base_weight: float, number_of_results: int
+    ) -> float | None:
+        """Weight of a single Transformation.
+
+        Parameters
+        ----------
+        base_weight: float
+            The average degree of the Transformation's end states.
+        number_of_results: int
+            The number of results already obtained for the Transformation.
+
+        Returns
+        -------
+        float | None
+            The decayed weight, or ``None`` if the Transformation
+            reached the ``cutoff`` or ``max_runs`` termination condition.
+        """
+        settings = self.settings
+
+        # keep the type checker happy
+        assert isinstance(settings, ConnectivityStrategySettings)
+
+        scaling_factor = self._exponential_decay_scaling(
+            number_of_results, settings.decay_rate
+        )
+        weight = scaling_factor * base_weight
+
+        match (settings.max_runs, settings.cutoff):
+            case (None, cutoff) if cutoff is not None:
+                if weight < cutoff:
+                    return None
+            case (max_runs, None) if max_runs is not None:
+                if number_of_results >= max_runs:
+                    return None
+            case (max_runs, cutoff) if max_runs is not None and cutoff is not None:
+                if weight < cutoff or number_of_results >= max_runs:
+                    return None
+
+        return weight
+
+    def _transformation_weights(
+        self, base_weights: np.ndarray, numbers_of_results: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized form of ``_transformation_weight``.
+
+        The weights are bit-identical to those of
+        ``_transformation_weight``, with ``NaN`` in place of ``None``.
+
+        Parameters
+        ----------
+        base_weights: np.ndarray
+            The average degree of the end states of each Transformation.
+        numbers_of_results: np.ndarray
+            The number of results already obtained for each Transformation.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        settings = self.settings
+
+        # keep the type checker happy
+        assert isinstance(settings, ConnectivityStrategySettings)
+
+        # NumPy's vectorized power can differ from Python's in the last
+        # bit, so the decay factor is evaluated once for each distinct
+        # number of results and gathered
+        distinct_numbers, inverse = np.unique(numbers_of_results, return_inverse=True)
+        scaling_factors = np.array(
+            [
+                self._exponential_decay_scaling(number_of_results, settings.decay_rate)
+                for number_of_results in distinct_numbers.tolist()
+            ],
+            dtype=np.float64,
+        )
+        weights = scaling_factors[inverse.reshape(-1)] * base_weights
+
+        terminated = np.zeros(len(weights), dtype=bool)
+        if settings.cutoff is not None:
+            terminated |= weights < settings.cutoff
+        if settings.max_runs is not None:
+            terminated |= numbers_of_results >= settings.max_runs
+        weights[terminated] = np.nan
+
+        return weights
+
     def _propose(
         self,
         alchemical_network: AlchemicalNetwork,
-        protocol_results: dict[GufeKey, ProtocolResult],
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
     ) -> StrategyResult:
         """Propose `Transformation` weight recommendations based on high connectivity nodes.
 
         Parameters
         ----------
         alchemical_network: AlchemicalNetwork
-        protocol_results: dict[GufeKey, ProtocolResult]
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int]
             A dictionary whose keys are the `GufeKey`s of `Transformation`s in the `AlchemicalNetwork`
-            and whose values are the `ProtocolResult`s for those `Transformation`s.
+            and whose values are the `ProtocolResult`s, `ResultSummary`s or ProtocolDAGResult counts
+            for those `Transformation`s.
 
         Returns
         -------
@@ -107,56 +203,120 @@ class ConnectivityStrategy(Strategy):
             A `StrategyResult` containing the proposed `Transformation` weights.
         """
 
-        settings = self.settings
+        return self._propose_index(
+            NetworkIndex.from_network(alchemical_network), protocol_results
+        )
 
-        # keep the type checker happy
-        assert isinstance(settings, ConnectivityStrategySettings)
+    def _propose_index(
+        self,
+        network_index: NetworkIndex,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> StrategyResult:
+        return self._propose_counts(
+            network_index, network_index.counts(protocol_results)
+        )
 
-        alchemical_network_mdg = alchemical_network.graph
-        weights: dict[GufeKey, float | None] = {}
+    def _propose_counts(
+        self,
+        network_index: NetworkIndex,
+        counts: np.ndarray,
+    ) -> StrategyResult:
+        degree = network_index.degree
+        base_weights = (
+            degree[network_index.edge_source] + degree[network_index.edge_target]
+        ) / 2
 
-        for state_a, state_b in alchemical_network_mdg.edges():
-            num_neighbors_a = alchemical_network_mdg.degree(state_a)
-            num_neighbors_b = alchemical_network_mdg.degree(state_b)
+        weights = self._transformation_weights(base_weights, counts)
 
-            # linter-satisfying assertion
-            assert isinstance(num_neighbors_a, int) and isinstance(num_neighbors_b, int)
+        return ArrayStrategyResult(
+            network_index.edge_keys, weights
+        ).to_strategy_result()
 
-            transformation_key = alchemical_network_mdg.get_edge_data(state_a, state_b)[
-                0
-            ]["object"].key
+    def incremental(
+        self,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> "ConnectivityIncrementalProposal":
+        """Create a stateful proposal that only reweighs the
+        Transformations whose ProtocolResults changed.
 
-            match (protocol_results.get(transformation_key)):
-                case None:
-                    transformation_n_protcol_dag_results = 0
-                case pr:
-                    assert isinstance(pr, ProtocolResult)
-                    transformation_n_protcol_dag_results = pr.n_protocol_dag_results
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int]
+            A dictionary whose keys are the `GufeKey`s of `Transformation`s in the `AlchemicalNetwork`
+            and whose values are the `ProtocolResult`s, `ResultSummary`s or ProtocolDAGResult counts
+            for those `Transformation`s.
 
-            scaling_factor = self._exponential_decay_scaling(
-                transformation_n_protcol_dag_results, settings.decay_rate
-            )
-            weight = scaling_factor * (num_neighbors_a + num_neighbors_b) / 2
-
-            match (settings.max_runs, settings.cutoff):
-                case (None, cutoff) if cutoff is not None:
-                    if weight < cutoff:
-                        weight = None
-                case (max_runs, None) if max_runs is not None:
-                    if transformation_n_protcol_dag_results >= max_runs:
-                        weight = None
-                case (max_runs, cutoff) if max_runs is not None and cutoff is not None:
-                    if (
-                        weight < cutoff
-                        or transformation_n_protcol_dag_results >= max_runs
-                    ):
-                        weight = None
-
-            weights[transformation_key] = weight
-
-        results = StrategyResult(weights=weights)
-        return results
+        Returns
+        -------
+        ConnectivityIncrementalProposal
+        """
+        return ConnectivityIncrementalProposal(
+            self, alchemical_network, protocol_results
+        )
 
     @classmethod
     def _default_settings(cls) -> StrategySettings:
         return ConnectivityStrategySettings(max_runs=3)
+
+
+class ConnectivityIncrementalProposal(VersionedProposal):
+    """Incremental proposals for the ConnectivityStrategy.
+
+    The average end state degree of every Transformation is computed
+    once when the proposal is created. Updates only recompute the
+    weights of the Transformations present in the provided
+    ``protocol_results``.
+    """
+
+    def __init__(
+        self,
+        strategy: ConnectivityStrategy,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ):
+        super().__init__(strategy, alchemical_network)
+
+        # node degrees within a connected subgraph are the same as
+        # within the full network, so there is no need to split the
+        # network into its subgraphs
+        network_index = NetworkIndex.from_network(alchemical_network)
+        degree = network_index.degree.tolist()
+        self._base_weights: dict[GufeKey, float] = {
+            transformation_key: (degree[state_a] + degree[state_b]) / 2
+            for transformation_key, state_a, state_b in zip(
+                network_index.edge_keys,
+                network_index.edge_source.tolist(),
+                network_index.edge_target.tolist(),
+            )
+        }
+
+        self._weights = {
+            transformation_key: strategy._transformation_weight(base_weight, 0)
+            for transformation_key, base_weight in self._base_weights.items()
+        }
+        self._reweigh(protocol_results)
+
+    def _reweigh(
+        self,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> dict[GufeKey, float | None]:
+        """Recompute the weights of the given Transformations,
+        returning those that changed."""
+        strategy = self._strategy
+        assert isinstance(strategy, ConnectivityStrategy)
+
+        changed: dict[GufeKey, float | None] = {}
+        for transformation_key, pr in protocol_results.items():
+            base_weight = self._base_weights.get(transformation_key)
+            # ignore results for Transformations outside of the network
+            if base_weight is None:
+                continue
+
+            weight = strategy._transformation_weight(base_weight, result_count(pr))
+            if weight != self._weights[transformation_key]:
+                changed[transformation_key] = weight
+
+        self._apply(changed)
+        return changed
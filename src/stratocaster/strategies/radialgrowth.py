@@ -1,5 +1,7 @@
-import networkx as nx
+from collections import defaultdict
+from typing import Literal
 
+import numpy as np
 from gufe import AlchemicalNetwork, ProtocolResult
 from gufe.tokenization import GufeKey
 
@@ -8,8 +10,11 @@ from pydantic import (
     field_validator,
 )
 
-from stratocaster.base import Strategy, StrategyResult
+from stratocaster.base import Strategy, StrategyResult, VersionedProposal
+from stratocaster.base.counts import ResultSummary, result_count
 from stratocaster.base.models import StrategySettings
+from stratocaster.base.tracing import phase
+from stratocaster.network import NetworkIndex
 
 
 class RadialGrowthStrategySettings(StrategySettings):
@@ -35,6 +40,26 @@ class RadialGrowthStrategySettings(StrategySettings):
         description="decay rate of the exponential distance decay penalty factor",
     )
 
+    eccentricity_mode: Literal["exact", "approximate"] = Field(
+        default="exact",
+        description="whether ChemicalSystem eccentricities are computed exactly or estimated from a limited number of BFS sweeps",
+    )
+
+    eccentricity_sweeps: int = Field(
+        default=16,
+        description="the maximum number of BFS sweeps per connected subgraph in the approximate eccentricity mode",
+    )
+
+    eccentricity_tolerance: int = Field(
+        default=0,
+        description="the largest accepted error bound of an approximate eccentricity",
+    )
+
+    eccentricity_seed: int = Field(
+        default=0,
+        description="the seed choosing the first BFS source of each connected subgraph in the approximate eccentricity mode",
+    )
+
     @field_validator("max_runs", mode="before")
     def validate_max_runs(cls, value):
         if not value >= 1:
@@ -49,6 +74,20 @@ class RadialGrowthStrategySettings(StrategySettings):
             )
         return value
 
+    @field_validator("eccentricity_sweeps", mode="before")
+    def validate_eccentricity_sweeps(cls, value):
+        if not value >= 1:
+            raise ValueError("`eccentricity_sweeps` must be greater than or equal to 1")
+        return value
+
+    @field_validator("eccentricity_tolerance", mode="before")
+    def validate_eccentricity_tolerance(cls, value):
+        if not value >= 0:
+            raise ValueError(
+                "`eccentricity_tolerance` must be greater than or equal to 0"
+            )
+        return value
+
     @field_validator("decay_repeat_rate", mode="before")
     def validate_decay_repeat_rate(cls, value):
         if not (0 < value < 1):
@@ -74,7 +113,9 @@ class RadialGrowthStrategy(Strategy):
     edge or only one edge has a result, the lowest completed distance
     is 2. In the former case, a transformation going from 3 to 4 has
     an effective distance of 1, while in the latter case it has a
-    distance of 2.
+    distance of 2. In general, the lowest completed distance of a
+    connected subgraph is the lowest end state eccentricity of any
+    of its Transformations without results.
 
     .. code-block::
 
@@ -92,6 +133,21 @@ class RadialGrowthStrategy(Strategy):
     distance. The ``candidacy_max_distance`` setting limits how far
     out transformations can be assigned non-zero weights.
 
+    Computing exact eccentricities can dominate the cost of a proposal
+    on very large networks. With ``eccentricity_mode="approximate"``,
+    eccentricities are instead estimated from at most
+    ``eccentricity_sweeps`` breadth-first searches per connected
+    subgraph, starting from a vertex chosen with
+    ``eccentricity_seed``, so the cost grows linearly with the size of
+    the network. Each estimate is a lower bound of the exact
+    eccentricity. Vertices whose bounds differ by at most
+    ``eccentricity_tolerance`` are accepted early, and with the default
+    tolerance of 0 an estimate is only inexact if the sweeps run out
+    before its bounds meet. Inexact estimates can place a
+    Transformation in a lower tier than it belongs to, so the weights
+    may differ from those of the exact mode, but they are
+    deterministic for a given seed.
+
     """
 
     _settings_cls = RadialGrowthStrategySettings
@@ -103,7 +159,7 @@ class RadialGrowthStrategy(Strategy):
     def _propose(
         self,
         alchemical_network: AlchemicalNetwork,
-        protocol_results: dict[GufeKey, ProtocolResult],
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
     ) -> StrategyResult:
         """Propose `Transformation` weight recommendations based on
         `Transformation` distance from the graph center.
@@ -113,7 +169,8 @@ class RadialGrowthStrategy(Strategy):
         alchemical_network
         protocol_results
             A dictionary whose keys are the `GufeKey`s of `Transformation`s in the `AlchemicalNetwork`
-            and whose values are the `ProtocolResult`s for those `Transformation`s.
+            and whose values are the `ProtocolResult`s, `ResultSummary`s or ProtocolDAGResult counts
+            for those `Transformation`s.
 
         Returns
         -------
@@ -122,79 +179,258 @@ class RadialGrowthStrategy(Strategy):
 
         """
 
-        alchemical_network_mdg = alchemical_network.graph
-        weights: dict[GufeKey, float | None] = {}
+        return self._propose_index(
+            NetworkIndex.from_network(alchemical_network), protocol_results
+        )
+
+    def _eccentricity(self, network_index: NetworkIndex) -> np.ndarray:
+        """The node eccentricities of the configured
+        ``eccentricity_mode``, which are cached for each network and
+        only computed on the first proposal."""
+        with phase("eccentricity"):
+            match self.settings.eccentricity_mode:
+                case "exact":
+                    return network_index.eccentricity
+                case "approximate":
+                    return network_index.approximate_eccentricity(
+                        self.settings.eccentricity_sweeps,
+                        tolerance=self.settings.eccentricity_tolerance,
+                        seed=self.settings.eccentricity_seed,
+                    )
+
+    def _transformation_weight(
+        self, number_of_results: int, distance: int
+    ) -> float | None:
+        """Weight of a single Transformation.
 
-        # calculate all node eccentricies
-        e = nx.eccentricity(alchemical_network_mdg.to_undirected())
+        Parameters
+        ----------
+        number_of_results: int
+            The number of results already obtained for the Transformation.
+        distance: int
+            The effective distance of the Transformation from the
+            lowest completed distance.
 
-        # start with the maximum value, this will be decremented as we
-        # see evidence the value should be lower
-        lowest_complete_eccentricity = max(e.values())
-        # hold on to the eccentricies of the transformations instead
-        # of the distances since we don't know the lowest complete
-        # eccentricity until we process the full graph, distances can
-        # be calculated after
-        transformation_eccentricity = {}
+        Returns
+        -------
+        float | None
+            The weight, or ``None`` if the Transformation reached
+            ``max_runs``.
+        """
+        settings = self.settings
 
-        for state_a, state_b in alchemical_network_mdg.edges():
+        # stop condition given max runs
+        if settings.max_runs <= number_of_results:
+            return None
+
+        if distance <= settings.candidacy_max_distance:
+            # edge case where there are multiple vertices with
+            # eccentricity equal to graph radius
+            if distance == 0:
+                distance_factor = 1.0
+            else:
+                # scale the distance factor to limit the
+                # calculation of far-out transformations
+                distance_factor = settings.decay_distance_rate ** (distance - 1)
+        else:
+            # set to zero, not None
+            distance_factor = 0.0
+
+        # scale the repeat factor to discourage reruns as specified by
+        # the user's decay_repeat_rate
+        return settings.decay_repeat_rate**number_of_results * distance_factor
+
+    def _propose_index(
+        self,
+        network_index: NetworkIndex,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> StrategyResult:
+        return self._propose_counts(
+            network_index, network_index.counts(protocol_results)
+        )
+
+    def _propose_counts(
+        self,
+        network_index: NetworkIndex,
+        counts: np.ndarray,
+    ) -> StrategyResult:
+        e = self._eccentricity(network_index).tolist()
+
+        transformations = []
+        # the lowest eccentricity tier with a Transformation without
+        # results, all tiers below it are complete
+        lowest_complete_eccentricity = max(e, default=0)
+        for transformation_key, state_a, state_b, n_results in zip(
+            network_index.edge_keys,
+            network_index.edge_source.tolist(),
+            network_index.edge_target.tolist(),
+            counts.tolist(),
+        ):
             edge = e[state_a], e[state_b]
             # find the range of eccentricies
             lower, upper = min(edge), max(edge)
 
-            transformation_key = alchemical_network_mdg.get_edge_data(state_a, state_b)[
-                0
-            ]["object"].key
-
-            factor_repeats = 1
-            match (protocol_results.get(transformation_key)):
-                case None:
-                    transformation_n_protcol_dag_results = 0
-                    # since we have no results for this
-                    # transformation, we know the lowest complete
-                    # eccentricity must be lower than the upper
-                    # eccentricity of the transformation
-                    if upper < lowest_complete_eccentricity:
-                        lowest_complete_eccentricity = lower
-                case pr:
-                    transformation_n_protcol_dag_results = pr.n_protocol_dag_results
-                    # scale the repeat factor to discourage reruns as
-                    # specified by the user's decay_repeat_rate
-                    factor_repeats *= (
-                        self.settings.decay_repeat_rate
-                        ** transformation_n_protcol_dag_results
-                    )
+            if n_results == 0:
+                lowest_complete_eccentricity = min(lowest_complete_eccentricity, lower)
+
+            # the upper eccentricity is the transformation's effective
+            # distance from the center
+            transformations.append((transformation_key, n_results, upper))
+
+        return StrategyResult(
+            {
+                transformation_key: self._transformation_weight(
+                    n_results, upper - lowest_complete_eccentricity
+                )
+                for transformation_key, n_results, upper in transformations
+            }
+        )
+
+    def incremental(
+        self,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> "RadialGrowthIncrementalProposal":
+        """Create a stateful proposal that tracks the lowest completed
+        distance of every connected subgraph as results arrive.
+
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int]
+            A dictionary whose keys are the `GufeKey`s of `Transformation`s in the `AlchemicalNetwork`
+            and whose values are the `ProtocolResult`s, `ResultSummary`s or ProtocolDAGResult counts
+            for those `Transformation`s.
+
+        Returns
+        -------
+        RadialGrowthIncrementalProposal
+        """
+        return RadialGrowthIncrementalProposal(
+            self, alchemical_network, protocol_results
+        )
+
+
+class RadialGrowthIncrementalProposal(VersionedProposal):
+    """Incremental proposals for the RadialGrowthStrategy.
 
-            # stop condition given max runs
-            if self.settings.max_runs <= transformation_n_protcol_dag_results:
-                weights[transformation_key] = None
+    The eccentricity tiers of every Transformation are found once when
+    the proposal is created. For each connected subgraph, the number of
+    Transformations without results is counted per tier, so the lowest
+    completed distance is found from these counts without scanning the
+    Transformations. Updates reweigh the Transformations present in the
+    provided ``protocol_results`` and, if the lowest completed distance
+    of their subgraph moved, the tiers whose distances changed.
+    """
+
+    def __init__(
+        self,
+        strategy: RadialGrowthStrategy,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ):
+        super().__init__(strategy, alchemical_network)
+
+        # the subgraph, lower and upper eccentricity of each Transformation
+        self._tiers: dict[GufeKey, tuple[int, int, int]] = {}
+        self._counts: dict[GufeKey, int] = {}
+        # per subgraph, the number of Transformations without results
+        # in each lower eccentricity tier and the Transformations of
+        # each upper eccentricity tier
+        self._missing: list[list[int]] = []
+        self._upper_tiers: list[dict[int, list[GufeKey]]] = []
+        self._lowest_complete: list[int] = []
+
+        network_index = NetworkIndex.from_network(alchemical_network)
+        for subgraph, component in enumerate(network_index.components):
+            e = strategy._eccentricity(component).tolist()
+            missing = [0] * (max(e, default=0) + 1)
+            upper_tiers = defaultdict(list)
+
+            for transformation_key, state_a, state_b in zip(
+                component.edge_keys,
+                component.edge_source.tolist(),
+                component.edge_target.tolist(),
+            ):
+                edge = e[state_a], e[state_b]
+                lower, upper = min(edge), max(edge)
+                self._tiers[transformation_key] = subgraph, lower, upper
+                self._counts[transformation_key] = 0
+                missing[lower] += 1
+                upper_tiers[upper].append(transformation_key)
+
+            self._missing.append(missing)
+            self._upper_tiers.append(dict(upper_tiers))
+            self._lowest_complete.append(self._find_lowest_complete(subgraph))
+
+        self._weights = {
+            transformation_key: strategy._transformation_weight(
+                0, upper - self._lowest_complete[subgraph]
+            )
+            for transformation_key, (subgraph, _, upper) in self._tiers.items()
+        }
+        self._reweigh(protocol_results)
+
+    def _find_lowest_complete(self, subgraph: int) -> int:
+        missing = self._missing[subgraph]
+        return next(
+            (tier for tier, n_missing in enumerate(missing) if n_missing),
+            len(missing) - 1,
+        )
+
+    def _reweigh(
+        self,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> dict[GufeKey, float | None]:
+        """Apply new results, returning the weights that changed."""
+        strategy = self._strategy
+        assert isinstance(strategy, RadialGrowthStrategy)
+
+        stale: set[GufeKey] = set()
+        moved: set[int] = set()
+        for transformation_key, pr in protocol_results.items():
+            tiers = self._tiers.get(transformation_key)
+            # ignore results for Transformations outside of the network
+            if tiers is None:
                 continue
 
-            # save the upper eccentricity for later when we know the
-            # lowest_completed. This is the transformation's effective
-            # distance from the center
-            transformation_eccentricity[transformation_key] = upper
-            weights[transformation_key] = factor_repeats
-
-        # start applying weights due to effective distance
-        for transformation_key, e in transformation_eccentricity.items():
-            distance = e - lowest_complete_eccentricity
-
-            if distance <= self.settings.candidacy_max_distance:
-                # edge case where there are multiple vertices with
-                # eccentricity equal to graph radius
-                if distance == 0:
-                    distance_factor = 1
-                else:
-                    # scale the distance factor to limit the
-                    # calculation of far-out transformations
-                    distance_factor = self.settings.decay_distance_rate ** (
-                        distance - 1
-                    )
-            else:
-                # set to zero, not None
-                distance_factor = 0
+            n_results = result_count(pr)
+            previous = self._counts[transformation_key]
+            if n_results == previous:
+                continue
 
-            weights[transformation_key] *= distance_factor
+            self._counts[transformation_key] = n_results
+            stale.add(transformation_key)
+            if (n_results == 0) != (previous == 0):
+                subgraph, lower, _ = tiers
+                self._missing[subgraph][lower] += 1 if n_results == 0 else -1
+                moved.add(subgraph)
+
+        for subgraph in moved:
+            previous = self._lowest_complete[subgraph]
+            lowest_complete = self._find_lowest_complete(subgraph)
+            if lowest_complete == previous:
+                continue
+
+            # tiers beyond the candidacy distance of both the previous
+            # and the new lowest completed distance keep a zero weight
+            self._lowest_complete[subgraph] = lowest_complete
+            limit = max(previous, lowest_complete) + (
+                strategy.settings.candidacy_max_distance
+            )
+            for upper, transformation_keys in self._upper_tiers[subgraph].items():
+                if upper <= limit:
+                    stale.update(transformation_keys)
+
+        changed: dict[GufeKey, float | None] = {}
+        for transformation_key in stale:
+            subgraph, _, upper = self._tiers[transformation_key]
+            weight = strategy._transformation_weight(
+                self._counts[transformation_key],
+                upper - self._lowest_complete[subgraph],
+            )
+            if weight != self._weights[transformation_key]:
+                changed[transformation_key] = weight
 
-        return StrategyResult(weights)
+        self._apply(changed)
+        return changed
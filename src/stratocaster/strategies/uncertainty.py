@@ -0,0 +1,389 @@
+import math
+import threading
+from importlib.util import find_spec
+
+import numpy as np
+from gufe import AlchemicalNetwork, ProtocolResult
+from gufe.tokenization import GufeKey
+
+from pydantic import (
+    Field,
+    field_validator,
+    model_validator,
+)
+
+from stratocaster.base import ArrayStrategyResult, Strategy, StrategyResult
+from stratocaster.base.cache import KeyedCache
+from stratocaster.base.counts import ResultSummary, result_count
+from stratocaster.base.models import StrategySettings
+from stratocaster.base.tracing import phase
+from stratocaster.network import NetworkIndex
+
+# the number of right-hand sides solved at once, bounding the memory of
+# a solve to _CHUNK_SIZE dense vectors
+_CHUNK_SIZE = 256
+
+
+class UncertaintyStrategySettings(StrategySettings):
+    """Settings required for the UncertaintyStrategy."""
+
+    default_uncertainty: float = Field(
+        default=1.0,
+        description="the assumed uncertainty of a single ProtocolDAG result, in kcal/mol, for results that do not report one",
+    )
+
+    prior_uncertainty: float = Field(
+        default=10.0,
+        description="the uncertainty of a Transformation without results, in kcal/mol",
+    )
+
+    cutoff: float | None = Field(
+        default=None,
+        description="unnormalized weight, i.e. variance reduction, cutoff used for termination condition",
+    )
+
+    max_runs: int | None = Field(
+        default=None,
+        description="the upper limit of protocol DAG results needed before a transformation is no longer weighed",
+    )
+
+    max_update_rank: int = Field(
+        default=0,
+        description="the number of changed Transformation weights applied as low-rank updates before the Laplacian is refactorized, 0 to always refactorize",
+    )
+
+    @field_validator("default_uncertainty", "prior_uncertainty", mode="before")
+    def validate_uncertainty(cls, value):
+        if not (0 < value):
+            raise ValueError("uncertainties must be greater than 0")
+        return value
+
+    @field_validator("cutoff", mode="before")
+    def validate_cutoff(cls, value):
+        if value is not None:
+            if not (0 < value):
+                raise ValueError("`cutoff` must be greater than 0")
+        return value
+
+    @field_validator("max_runs", mode="before")
+    def validate_max_runs(cls, value):
+        if value is not None:
+            if not value >= 1:
+                raise ValueError("`max_runs` must be greater than or equal to 1")
+        return value
+
+    @field_validator("max_update_rank", mode="before")
+    def validate_max_update_rank(cls, value):
+        if not value >= 0:
+            raise ValueError("`max_update_rank` must be greater than or equal to 0")
+        return value
+
+    @model_validator(mode="before")
+    def check_cutoff_or_max_runs(cls, values):
+        """Check that at either max_runs or cutoff is set."""
+        max_runs, cutoff = values.get("max_runs"), values.get("cutoff")
+
+        if max_runs is None and cutoff is None:
+            raise ValueError("At least one of `max_runs` or `cutoff` must be set")
+
+        return values
+
+
+def _result_uncertainty(
+    result: ProtocolResult | ResultSummary | int | None,
+) -> float | None:
+    """The uncertainty reported by a result in kcal/mol, or ``None`` if
+    it reports none."""
+    get_uncertainty = getattr(result, "get_uncertainty", None)
+    if get_uncertainty is None:
+        return None
+
+    try:
+        uncertainty = get_uncertainty()
+    # results without enough data to estimate an uncertainty
+    except (LookupError, TypeError, ValueError):
+        return None
+
+    if hasattr(uncertainty, "m_as"):
+        uncertainty = uncertainty.m_as("kcal/mol")
+    uncertainty = float(uncertainty)
+
+    if not (math.isfinite(uncertainty) and uncertainty > 0):
+        return None
+    return uncertainty
+
+
+class _GroundedLaplacian:
+    r"""The weighted Laplacian of a connected network and the statistics
+    of its edges needed for variance reductions.
+
+    Node ``0`` is the reference node, whose row and column are removed
+    so that the remaining "grounded" Laplacian is positive definite.
+    It is factorized once with a sparse LU decomposition, after which
+    the effective resistance :math:`b_e^T L^+ b_e` and the norm
+    :math:`\lVert L^+ b_e \rVert^2` of every edge are computed with
+    chunked solves. Later weight changes are applied to these
+    statistics with the Woodbury identity, which costs two solves per
+    changed weight, until more than ``max_update_rank`` weights differ
+    from the factorized ones and the Laplacian is refactorized.
+    """
+
+    def __init__(self, network_index: NetworkIndex, weights: np.ndarray):
+        from scipy.sparse import csr_matrix
+
+        n_edges = network_index.n_edges
+        self.n_nodes = network_index.n_nodes
+        self.edge_source = network_index.edge_source
+        self.edge_target = network_index.edge_target
+
+        rows = np.repeat(np.arange(n_edges), 2)
+        columns = np.stack([self.edge_source, self.edge_target], axis=1).ravel()
+        values = np.tile([1.0, -1.0], n_edges)
+        self.incidence = csr_matrix(
+            (values, (rows, columns)), shape=(n_edges, self.n_nodes)
+        )
+
+        self.lock = threading.Lock()
+        self.n_factorizations = 0
+        self._factorize(weights)
+
+    def _solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Multiply by the grounded covariance, padded with a zero row
+        and column for the reference node."""
+        solution = np.zeros_like(rhs)
+        solution[1:] = self._lu.solve(rhs[1:])
+        return solution
+
+    def _factorize(self, weights: np.ndarray):
+        from scipy.sparse import diags
+        from scipy.sparse.linalg import splu
+
+        grounded_incidence = self.incidence[:, 1:]
+        laplacian = grounded_incidence.T @ diags(weights) @ grounded_incidence
+        self._lu = splu(laplacian.tocsc())
+        self._factorized_weights = weights.copy()
+        self.n_factorizations += 1
+
+        n_edges = len(weights)
+        self._resistances = np.empty(n_edges)
+        self._norms = np.empty(n_edges)
+        incidence_transpose = self.incidence.T.tocsc()
+        for start in range(0, n_edges, _CHUNK_SIZE):
+            stop = min(start + _CHUNK_SIZE, n_edges)
+            rhs = incidence_transpose[:, start:stop].toarray()
+            solutions = self._solve(rhs)
+
+            self._resistances[start:stop] = np.einsum("ij,ij->j", rhs, solutions)
+            # L^+ b_e is the solution with its mean removed
+            self._norms[start:stop] = (solutions**2).sum(axis=0) - solutions.sum(
+                axis=0
+            ) ** 2 / self.n_nodes
+
+    def statistics(
+        self, weights: np.ndarray, max_update_rank: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the effective resistance and the norm of every edge for
+        the Laplacian with the given edge weights."""
+        (changed,) = np.nonzero(weights != self._factorized_weights)
+        if len(changed) > max_update_rank:
+            self._factorize(weights)
+        if len(changed) > max_update_rank or not len(changed):
+            return self._resistances, self._norms
+
+        # L' = L + U D U^T, with U the incidence vectors of the changed
+        # edges and D their weight differences, has the covariance
+        # C' = C - Z G Z^T with Z = C U and G = (D^-1 + U^T Z)^-1
+        update_basis = self.incidence[changed].T.toarray()
+        solved_basis = self._solve(update_basis)
+        capacitance = np.diag(
+            1 / (weights[changed] - self._factorized_weights[changed])
+        ) + (update_basis.T @ solved_basis)
+        inverse_capacitance = np.linalg.inv(capacitance)
+
+        centered_basis = solved_basis - solved_basis.mean(axis=0)
+        covariance_basis = self._solve(centered_basis)
+        basis_gram = solved_basis.T @ centered_basis
+
+        # Z^T b_e and G Z^T b_e of every edge
+        projections = solved_basis[self.edge_source] - solved_basis[self.edge_target]
+        corrections = projections @ inverse_capacitance
+
+        resistances = self._resistances - np.einsum(
+            "ij,ij->i", projections, corrections
+        )
+        norms = (
+            self._norms
+            - 2
+            * np.einsum(
+                "ij,ij->i",
+                covariance_basis[self.edge_source] - covariance_basis[self.edge_target],
+                corrections,
+            )
+            + np.einsum("ij,ij->i", corrections @ basis_gram, corrections)
+        )
+        return resistances, norms
+
+
+_laplacian_cache: KeyedCache[_GroundedLaplacian] = KeyedCache(maxsize=64)
+
+
+class UncertaintyStrategy(Strategy):
+    r"""A Strategy that favors Transformations whose next result most
+    reduces the uncertainty of the network's free energies.
+
+    Node free energies are estimated from the Transformation results by
+    weighted least squares, with each Transformation weighted by the
+    inverse variance :math:`w_e` of its result. Their covariance is the
+    pseudo-inverse :math:`L^+` of the weighted graph Laplacian
+    :math:`L = B^T W B`, and the network-wide variance is measured by
+    :math:`\operatorname{tr} L^+`, proportional to the sum of the
+    variances of all pairwise free energy differences. One more result
+    for a Transformation :math:`e` increases its weight by
+    :math:`\delta_e`, the inverse variance of a single result, and by
+    the Sherman-Morrison formula reduces the network-wide variance by
+
+    .. math::
+
+        \frac{\delta_e \lVert L^+ b_e \rVert^2}{1 + \delta_e b_e^T L^+ b_e}
+
+    where :math:`b_e` is the incidence vector of the Transformation.
+    This reduction is its weight.
+
+    The uncertainty of a Transformation is read from
+    ``ProtocolResult.get_uncertainty``. A single result is assumed to
+    have ``n_protocol_dag_results`` times its variance. Results that do
+    not report an uncertainty, such as plain counts, are assigned the
+    ``default_uncertainty`` for every ProtocolDAG result. Every
+    Transformation also carries a weak prior of ``prior_uncertainty``,
+    which keeps the Laplacian of each connected subgraph invertible.
+
+    The Laplacian is factorized with a sparse LU decomposition, which
+    requires SciPy, and the factorization is cached per subgraph, so
+    repeated proposals with unchanged weights do not refactorize it.
+    By default, any changed weight refactorizes the Laplacian, and a
+    proposal only depends on the network and its results. A positive
+    ``max_update_rank`` opts into low-rank updates instead: proposals
+    whose weights differ in at most ``max_update_rank`` Transformations
+    from the factorized ones reuse the factorization, which is much
+    cheaper after a few new results. These proposals depend on the
+    factorization they start from, and so can differ by round-off
+    between processes or with the order of earlier proposals.
+
+    .. note::
+
+       Since the weights depend on the reported uncertainties, proposals
+       of this Strategy must not be memoized with
+       :class:`~stratocaster.base.memo.ProposalCache`, which only
+       considers result counts.
+    """
+
+    _settings_cls = UncertaintyStrategySettings
+
+    def __init__(self, settings: UncertaintyStrategySettings):
+        # fail on creation rather than on the first proposal
+        if find_spec("scipy") is None:
+            raise ImportError(
+                "The UncertaintyStrategy requires SciPy, install it with the "
+                "`uncertainty` extra: pip install 'stratocaster[uncertainty]'"
+            )
+        super().__init__(settings)
+
+    @classmethod
+    def _default_settings(cls) -> StrategySettings:
+        return UncertaintyStrategySettings(max_runs=3)
+
+    def _propose(
+        self,
+        alchemical_network: AlchemicalNetwork,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> StrategyResult:
+        """Propose `Transformation` weights that favor the largest
+        reduction in the network-wide free energy variance.
+
+        Parameters
+        ----------
+        alchemical_network: AlchemicalNetwork
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int]
+            A dictionary whose keys are the `GufeKey`s of `Transformation`s in the `AlchemicalNetwork`
+            and whose values are the `ProtocolResult`s, `ResultSummary`s or ProtocolDAGResult counts
+            for those `Transformation`s.
+
+        Returns
+        -------
+        StrategyResult
+            A `StrategyResult` containing the proposed `Transformation` weights.
+        """
+        return self._propose_index(
+            NetworkIndex.from_network(alchemical_network), protocol_results
+        )
+
+    def _propose_index(
+        self,
+        network_index: NetworkIndex,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> StrategyResult:
+        settings = self.settings
+
+        # keep the type checker happy
+        assert isinstance(settings, UncertaintyStrategySettings)
+
+        weights = np.full(network_index.n_edges, np.nan)
+        for component in network_index.components:
+            if component.n_edges:
+                positions = network_index.edge_keys.positions(component.edge_keys)
+                weights[positions] = self._variance_reductions(
+                    component, protocol_results
+                )
+
+        return ArrayStrategyResult(
+            network_index.edge_keys, weights
+        ).to_strategy_result()
+
+    def _variance_reductions(
+        self,
+        network_index: NetworkIndex,
+        protocol_results: dict[GufeKey, ProtocolResult | ResultSummary | int],
+    ) -> np.ndarray:
+        """The weights of the Transformations of a connected network."""
+        settings = self.settings
+
+        # keep the type checker happy
+        assert isinstance(settings, UncertaintyStrategySettings)
+
+        counts = np.zeros(network_index.n_edges, dtype=np.int64)
+        run_variances = np.full(network_index.n_edges, settings.default_uncertainty**2)
+        for position, key in enumerate(network_index.edge_keys):
+            result = protocol_results.get(key)
+            counts[position] = count = result_count(result)
+            if count and (uncertainty := _result_uncertainty(result)) is not None:
+                run_variances[position] = count * uncertainty**2
+
+        # inverse variance of the current estimate and of one more result
+        weights = 1 / settings.prior_uncertainty**2 + counts / run_variances
+        increments = 1 / run_variances
+
+        with phase("factorize"):
+            # the node labels are part of the key, as they define the
+            # rows and columns of the factorized Laplacian
+            laplacian = _laplacian_cache.get_or_compute(
+                (
+                    network_index.edge_keys,
+                    network_index.edge_source.tobytes(),
+                    network_index.edge_target.tobytes(),
+                ),
+                lambda: _GroundedLaplacian(network_index, weights),
+            )
+
+        with laplacian.lock, phase("solve"):
+            resistances, norms = laplacian.statistics(weights, settings.max_update_rank)
+
+        reductions = increments * norms / (1 + increments * resistances)
+
+        terminated = np.zeros(network_index.n_edges, dtype=bool)
+        if settings.max_runs is not None:
+            terminated |= counts >= settings.max_runs
+        if settings.cutoff is not None:
+            terminated |= reductions < settings.cutoff
+        reductions[terminated] = np.nan
+
+        return reductions
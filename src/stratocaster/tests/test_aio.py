@@ -0,0 +1,117 @@
+import asyncio
+import threading
+
+import pytest
+
+from stratocaster.base import AsyncProposer
+from stratocaster.strategies import ConnectivityStrategy, RadialGrowthStrategy
+
+
+@pytest.mark.parametrize("strategy_class", [ConnectivityStrategy, RadialGrowthStrategy])
+def test_stream_coalesces_bursts(disconnected_fanning_network, strategy_class):
+    strategy = strategy_class(strategy_class.default_settings())
+    keys = sorted(
+        transformation.key for transformation in disconnected_fanning_network.edges
+    )
+    bursts = [
+        [(keys[0], 1), (keys[1], 1), (keys[2], 2)],
+        [(keys[0], 2), (keys[3], 1)],
+    ]
+
+    async def run():
+        proposer = AsyncProposer(strategy, disconnected_fanning_network)
+        assert proposer.result == strategy.propose(disconnected_fanning_network, {})
+
+        next_burst = asyncio.Event()
+
+        async def events():
+            for burst in bursts:
+                await next_burst.wait()
+                next_burst.clear()
+                # a burst is delivered without yielding to the consumer
+                for event in burst:
+                    yield event
+
+        results = []
+        next_burst.set()
+        async for result in proposer.stream(events()):
+            results.append(result)
+            next_burst.set()
+
+        return proposer, results
+
+    proposer, results = asyncio.run(run())
+
+    counts = {}
+    assert len(results) == len(bursts)
+    for burst, result in zip(bursts, results):
+        counts |= dict(burst)
+        assert result == strategy.propose(disconnected_fanning_network, counts)
+    assert proposer.result == results[-1]
+
+
+def test_concurrent_updates(fanning_network):
+    strategy = ConnectivityStrategy(ConnectivityStrategy.default_settings())
+    keys = sorted(transformation.key for transformation in fanning_network.edges)
+
+    async def run():
+        proposer = AsyncProposer(strategy, fanning_network)
+        initial = proposer.result
+        initial_weights = initial.weights
+
+        started = threading.Event()
+        release = threading.Event()
+        running = []
+        update = proposer._proposal.update
+
+        def blocking_update(counts):
+            running.append(counts)
+            assert len(running) == 1
+            started.set()
+            release.wait()
+            try:
+                return update(counts)
+            finally:
+                running.pop()
+
+        proposer._proposal.update = blocking_update
+
+        first = asyncio.create_task(proposer.update({keys[0]: 1}))
+        second = asyncio.create_task(proposer.update({keys[1]: 2}))
+        await asyncio.to_thread(started.wait)
+
+        # the published result is unchanged while an update is running
+        assert proposer.result is initial
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert initial.weights == initial_weights
+        return proposer
+
+    proposer = asyncio.run(run())
+    assert proposer.result == strategy.propose(
+        fanning_network, {keys[0]: 1, keys[1]: 2}
+    )
+
+
+def test_stream_error(fanning_network):
+    strategy = ConnectivityStrategy(ConnectivityStrategy.default_settings())
+
+    async def events():
+        yield next(iter(fanning_network.edges)).key, 1
+        raise RuntimeError("lost connection")
+
+    async def run():
+        proposer = AsyncProposer(strategy, fanning_network, coalesce_delay=0.01)
+        async for _ in proposer.stream(events()):
+            pass
+
+    with pytest.raises(RuntimeError, match="lost connection"):
+        asyncio.run(run())
+
+
+def test_invalid_coalesce_delay(fanning_network):
+    strategy = ConnectivityStrategy(ConnectivityStrategy.default_settings())
+
+    with pytest.raises(ValueError):
+        AsyncProposer(strategy, fanning_network, coalesce_delay=-1)
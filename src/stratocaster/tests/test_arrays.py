@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+from gufe.tokenization import GufeKey
+
+from stratocaster.base import ArrayStrategyResult, KeyTable, StrategyResult
+
+
+class TestKeyTable:
+
+    keys = [
+        GufeKey("MyTransformation-ABC123"),
+        GufeKey("MyTransformation-321CBA"),
+        GufeKey("MyOtherTransformation-789xyz"),
+    ]
+
+    def test_positions(self):
+        table = KeyTable(self.keys)
+
+        assert len(table) == 3
+        assert list(table) == self.keys
+        assert table.position(self.keys[2]) == 2
+        assert table[1] == self.keys[1]
+        assert table.positions(reversed(self.keys)).tolist() == [2, 1, 0]
+
+    def test_duplicate_keys(self):
+        with pytest.raises(ValueError):
+            KeyTable(self.keys + self.keys[:1])
+
+    def test_missing_key(self):
+        with pytest.raises(KeyError):
+            KeyTable(self.keys[:2]).positions(self.keys)
+
+
+class TestArrayStrategyResult:
+
+    result = StrategyResult(
+        {
+            GufeKey("MyTransformation-ABC123"): 1.0,
+            GufeKey("MyTransformation-321CBA"): None,
+            GufeKey("MyOtherTransformation-789xyz"): 10.0,
+        }
+    )
+
+    def test_roundtrip(self):
+        array_result = self.result.to_array()
+
+        assert array_result.to_strategy_result() == self.result
+        assert array_result.mask.tolist() == [True, False, True]
+
+    def test_shared_key_table(self):
+        extra_key = GufeKey("MyTransformation-DEF456")
+        table = KeyTable([extra_key, *self.result.weights])
+
+        array_result = self.result.to_array(table)
+
+        assert array_result.key_table is table
+        assert np.isnan(array_result.weights[0])
+        assert array_result.to_strategy_result().weights == self.result.weights | {
+            extra_key: None
+        }
+
+    def test_resolve(self):
+        resolved = self.result.resolve()
+        array_resolved = self.result.to_array().resolve()
+
+        for key, value in zip(self.result.weights, array_resolved.tolist()):
+            if resolved[key] is None:
+                assert np.isnan(value)
+            else:
+                assert resolved[key] == value
+
+    def test_resolve_all_none(self):
+        result = ArrayStrategyResult(KeyTable(self.result.weights), np.full(3, np.nan))
+        assert np.isnan(result.resolve()).all()
+
+    def test_weights_read_only_view(self):
+        weights = np.array([1.0, np.nan, 10.0])
+        array_result = ArrayStrategyResult(KeyTable(self.result.weights), weights)
+
+        assert np.shares_memory(array_result.weights, weights)
+        with pytest.raises(ValueError):
+            array_result.weights[0] = 2.0
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError):
+            ArrayStrategyResult(KeyTable(self.result.weights), np.ones(2))
+
+
+class TestArrayStrategyResultSerialization:
+
+    array_result = StrategyResult(
+        {
+            GufeKey("MyTransformation-ABC123"): 1.0,
+            GufeKey("MyTransformation-321CBA"): None,
+            GufeKey("MyOtherTransformation-789xyz"): 10.0,
+        }
+    ).to_array()
+
+    @staticmethod
+    def assert_same(loaded, expected):
+        assert loaded.key_table == expected.key_table
+        np.testing.assert_array_equal(loaded.weights, expected.weights)
+        assert loaded.to_strategy_result() == expected.to_strategy_result()
+
+    def test_bytes_roundtrip(self):
+        data = self.array_result.to_bytes()
+        self.assert_same(ArrayStrategyResult.from_bytes(data), self.array_result)
+
+    @pytest.mark.parametrize("mmap_mode", [None, "r"])
+    def test_file_roundtrip(self, tmp_path, mmap_mode):
+        path = tmp_path / "result.bin"
+        self.array_result.save(path)
+
+        loaded = ArrayStrategyResult.load(path, mmap_mode=mmap_mode)
+        self.assert_same(loaded, self.array_result)
+
+        if mmap_mode is not None:
+            bases = []
+            array = loaded.weights
+            while array is not None:
+                bases.append(array)
+                array = getattr(array, "base", None)
+            assert any(isinstance(base, np.memmap) for base in bases)
+
+    def test_stream(self, tmp_path):
+        """Several results can be written to and read from one stream."""
+        path = tmp_path / "results.bin"
+        empty = StrategyResult({}).to_array()
+
+        with open(path, "wb") as f:
+            self.array_result.save(f)
+            empty.save(f)
+
+        with open(path, "rb") as f:
+            self.assert_same(ArrayStrategyResult.load(f), self.array_result)
+            self.assert_same(ArrayStrategyResult.load(f), empty)
+
+    def test_empty_mmap(self, tmp_path):
+        path = tmp_path / "result.bin"
+        empty = StrategyResult({}).to_array()
+        empty.save(path)
+
+        self.assert_same(ArrayStrategyResult.load(path, mmap_mode="r"), empty)
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ValueError):
+            ArrayStrategyResult.from_bytes(b"not a result")
+
+        with pytest.raises(ValueError):
+            with open(tmp_path / "result.bin", "wb") as f:
+                ArrayStrategyResult.load(f, mmap_mode="r")
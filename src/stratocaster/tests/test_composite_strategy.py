@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+from gufe.tests.test_protocol import DummyProtocolResult
+
+from stratocaster.base.strategy import StrategyResult
+from stratocaster.network import NetworkIndex
+from stratocaster.strategies import (
+    CompositeStrategy,
+    ConnectivityStrategy,
+    RadialGrowthStrategy,
+)
+from stratocaster.strategies.composite import CompositeStrategySettings
+from stratocaster.strategies.connectivity import ConnectivityStrategySettings
+
+from stratocaster.tests.utils import StrategyTestMixin
+
+
+def children():
+    return [
+        ConnectivityStrategy(ConnectivityStrategySettings(max_runs=3)),
+        RadialGrowthStrategy(RadialGrowthStrategy._default_settings()),
+    ]
+
+
+class TestCompositeStrategy(StrategyTestMixin):
+
+    strategy_class = CompositeStrategy
+    valid_settings = [
+        CompositeStrategySettings(blend=blend, blend_weights=blend_weights)
+        for blend, blend_weights in [
+            ("sum", None),
+            ("product", [1.0, 0.5]),
+            ("max", [2.0, 1.0]),
+        ]
+    ]
+
+    @property
+    def default_strategy(self):
+        if not self._default_strategy:
+            self._default_strategy = self.strategy_class(
+                self.default_settings, children()
+            )
+        return self._default_strategy
+
+    def strategy_or_default(self, settings):
+        if settings:
+            return self.strategy_class(settings, children())
+        return self.default_strategy
+
+    @pytest.mark.parametrize("settings", valid_settings)
+    def test_simulated_termination(self, fanning_network, settings):
+
+        StrategyTestMixin.test_simulated_termination(
+            self, fanning_network, settings=settings
+        )
+
+    @pytest.mark.parametrize("settings", valid_settings)
+    def test_blend(self, fanning_network, settings):
+
+        strategy = self.strategy_or_default(settings)
+        blend_weights = settings.blend_weights or [1.0, 1.0]
+
+        protocol_results = {
+            transformation.key: DummyProtocolResult(
+                n_protocol_dag_results=n % 5, info=f"key: {transformation.key}"
+            )
+            for n, transformation in enumerate(fanning_network.edges)
+        }
+
+        proposal = strategy.propose(fanning_network, protocol_results)
+        child_proposals = [
+            child.propose(fanning_network, protocol_results)
+            for child in strategy.strategies
+        ]
+
+        for key, weight in proposal.weights.items():
+            child_weights = [
+                child_proposal.weights[key] for child_proposal in child_proposals
+            ]
+            present = [
+                (blend_weight, child_weight)
+                for blend_weight, child_weight in zip(blend_weights, child_weights)
+                if child_weight is not None
+            ]
+
+            match settings.blend:
+                case "sum":
+                    expected = sum(bw * cw for bw, cw in present) if present else None
+                case "max":
+                    expected = max(bw * cw for bw, cw in present) if present else None
+                case "product":
+                    expected = (
+                        float(np.prod([cw**bw for bw, cw in present]))
+                        if len(present) == len(child_weights)
+                        else None
+                    )
+
+            if expected is None:
+                assert weight is None
+            else:
+                assert weight == pytest.approx(expected)
+
+    def test_single_child(self, fanning_network):
+
+        child = ConnectivityStrategy(ConnectivityStrategy._default_settings())
+        strategy = CompositeStrategy(CompositeStrategySettings(), [child])
+
+        proposal = strategy.propose(fanning_network, {})
+        expected = child.propose(fanning_network, {})
+
+        assert proposal.weights.keys() == expected.weights.keys()
+        for key, weight in expected.weights.items():
+            assert proposal.weights[key] == pytest.approx(weight)
+
+    def test_overridden_child(self, disconnected_fanning_network):
+
+        class OverriddenStrategy(ConnectivityStrategy):
+            def _propose(self, alchemical_network, protocol_results):
+                return StrategyResult(
+                    {
+                        transformation.key: 0.25
+                        for transformation in alchemical_network.edges
+                    }
+                )
+
+        child = OverriddenStrategy(ConnectivityStrategySettings(max_runs=3))
+        strategy = CompositeStrategy(self.default_settings, [child])
+
+        # a child overriding _propose is not proposed through its index
+        assert not strategy._indexed
+        assert strategy.propose(disconnected_fanning_network, {}) == child.propose(
+            disconnected_fanning_network, {}
+        )
+
+    def test_shared_counts(self, disconnected_fanning_network, monkeypatch):
+
+        calls = []
+        counts = NetworkIndex.counts
+
+        def counting(self, protocol_results):
+            calls.append(self)
+            return counts(self, protocol_results)
+
+        monkeypatch.setattr(NetworkIndex, "counts", counting)
+
+        protocol_results = {
+            transformation.key: n % 3
+            for n, transformation in enumerate(disconnected_fanning_network.edges)
+        }
+
+        child = ConnectivityStrategy(ConnectivityStrategySettings(max_runs=3))
+        expected = child.propose(disconnected_fanning_network, protocol_results)
+        n_components = len(calls)
+        calls.clear()
+
+        # nested composites also resolve the counts once per component
+        strategy = CompositeStrategy(
+            self.default_settings,
+            [
+                CompositeStrategy(self.default_settings, children()),
+                *children(),
+            ],
+        )
+        assert strategy._counted
+
+        proposal = strategy.propose(disconnected_fanning_network, protocol_results)
+        assert len(calls) == n_components
+        assert len(set(map(id, calls))) == n_components
+
+        single = CompositeStrategy(CompositeStrategySettings(), [child])
+        assert single.propose(disconnected_fanning_network, protocol_results) == (
+            expected
+        )
+        assert proposal.weights.keys() == expected.weights.keys()
+
+    def test_dict_roundtrip(self):
+
+        strategy = self.default_strategy
+        restored = CompositeStrategy.from_dict(strategy.to_dict())
+
+        assert restored == strategy
+        assert restored.strategies == strategy.strategies
+
+        other = CompositeStrategy(self.default_settings, children()[::-1])
+        assert other.key != strategy.key
+
+    def test_invalid(self):
+
+        with pytest.raises(ValueError, match="at least one Strategy"):
+            CompositeStrategy(CompositeStrategySettings(), [])
+
+        with pytest.raises(ValueError, match="Expected 2 `blend_weights`"):
+            CompositeStrategy(
+                CompositeStrategySettings(blend_weights=[1.0]), children()
+            )
+
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
+            CompositeStrategySettings(blend_weights=[1.0, -1.0])
@@ -1,6 +1,7 @@
 import math
 from random import randint, shuffle
 
+import numpy as np
 import pytest
 from gufe import AlchemicalNetwork
 from gufe.tests.test_protocol import DummyProtocol, DummyProtocolResult
@@ -112,6 +113,42 @@ class TestConnectivityStrategy(StrategyTestMixin):
             weight for weight in proposal.resolve().values() if weight is not None
         )
 
+    def test_incremental_shared_result(self, fanning_network):
+        incremental = self.default_strategy.incremental(fanning_network, {})
+        transformation_key = next(iter(fanning_network.edges)).key
+
+        # the result is only rebuilt once a weight changes
+        previous = incremental.result
+        assert incremental.update({}) is previous
+        assert incremental.update({transformation_key: 0}) is previous
+
+        weights = previous.weights
+        proposal = incremental.update({transformation_key: 1})
+        assert proposal is not previous
+        assert previous.weights == weights
+        assert proposal.weights[transformation_key] != weights[transformation_key]
+
+    @pytest.mark.parametrize("settings", valid_settings)
+    def test_vectorized_weights_identical(self, settings):
+        """The vectorized kernel reproduces the per-Transformation
+        weights exactly."""
+        strategy = self.strategy_or_default(settings)
+
+        rng = np.random.default_rng(0)
+        base_weights = rng.integers(2, 40, size=500) / 2
+        numbers_of_results = rng.integers(0, 12, size=500)
+
+        weights = strategy._transformation_weights(base_weights, numbers_of_results)
+
+        for weight, base_weight, number_of_results in zip(
+            weights.tolist(), base_weights.tolist(), numbers_of_results.tolist()
+        ):
+            expected = strategy._transformation_weight(base_weight, number_of_results)
+            if expected is None:
+                assert math.isnan(weight)
+            else:
+                assert weight == expected
+
     @pytest.mark.parametrize(
         ["decay_rate", "cutoff", "max_runs"],
         [
@@ -0,0 +1,111 @@
+import networkx as nx
+import pytest
+
+from stratocaster.base.cache import KeyedCache
+from stratocaster.network import eccentricities, network_eccentricity
+from stratocaster.network import index as index_module
+
+
+def adjacency_from_graph(graph: nx.Graph) -> tuple[list, list[list[int]]]:
+    nodes = list(graph.nodes)
+    node_index = {node: index for index, node in enumerate(nodes)}
+    return nodes, [[node_index[neighbor] for neighbor in graph[node]] for node in nodes]
+
+
+@pytest.mark.parametrize(
+    "graph",
+    [
+        nx.path_graph(1),
+        nx.path_graph(2),
+        nx.path_graph(9),
+        nx.star_graph(20),
+        nx.balanced_tree(3, 4),
+        nx.grid_2d_graph(4, 7),
+        nx.random_labeled_tree(200, seed=1),
+        nx.gnm_random_graph(60, 90, seed=2),
+    ],
+)
+def test_eccentricities_match_networkx(graph):
+    nodes, adjacency = adjacency_from_graph(graph)
+    result = eccentricities(adjacency)
+
+    for component in nx.connected_components(graph):
+        expected = nx.eccentricity(graph.subgraph(component))
+        for node, eccentricity in expected.items():
+            assert result[nodes.index(node)] == eccentricity
+
+
+def test_network_eccentricity(fanning_network):
+    expected = nx.eccentricity(fanning_network.graph.to_undirected())
+    assert dict(network_eccentricity(fanning_network)) == expected
+
+
+def test_network_eccentricity_cached(fanning_network, monkeypatch):
+    monkeypatch.setattr(index_module, "_index_cache", KeyedCache())
+
+    calls = []
+
+    def counting_eccentricities(adjacency):
+        calls.append(adjacency)
+        return eccentricities(adjacency)
+
+    monkeypatch.setattr(index_module, "eccentricities", counting_eccentricities)
+
+    first = network_eccentricity(fanning_network)
+    second = network_eccentricity(fanning_network)
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_keyed_cache_eviction():
+    cache = KeyedCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # touch "a" so that "b" is the least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get_or_compute("a", lambda: 0) == 1
+    assert cache.get_or_compute("d", lambda: 4) == 4
+    assert len(cache) == 2
+
+
+def test_keyed_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        KeyedCache(maxsize=0)
+
+
+APPROXIMATE_GRAPHS = [
+    nx.balanced_tree(3, 4),
+    nx.grid_2d_graph(6, 9),
+    nx.random_labeled_tree(300, seed=3),
+    nx.gnm_random_graph(80, 120, seed=4),
+]
+
+
+@pytest.mark.parametrize("graph", APPROXIMATE_GRAPHS)
+@pytest.mark.parametrize("max_sweeps", [1, 2, 4])
+def test_approximate_eccentricities_are_lower_bounds(graph, max_sweeps):
+    _, adjacency = adjacency_from_graph(graph)
+    exact = eccentricities(adjacency)
+
+    approximate = eccentricities(adjacency, max_sweeps=max_sweeps, seed=0)
+    assert all(low <= high for low, high in zip(approximate, exact))
+
+    # the estimates are deterministic for a seed
+    assert approximate == eccentricities(adjacency, max_sweeps=max_sweeps, seed=0)
+
+
+@pytest.mark.parametrize("graph", APPROXIMATE_GRAPHS)
+@pytest.mark.parametrize("tolerance", [0, 1, 2])
+def test_approximate_eccentricities_tolerance(graph, tolerance):
+    _, adjacency = adjacency_from_graph(graph)
+    exact = eccentricities(adjacency)
+
+    approximate = eccentricities(adjacency, tolerance=tolerance, seed=1)
+    assert all(0 <= high - low <= tolerance for low, high in zip(approximate, exact))
+
+    if tolerance == 0:
+        assert approximate == exact
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import stratocaster.strategies
+
+HEAVY_MODULES = ["gufe", "networkx", "numpy", "pydantic", "scipy"]
+STRATEGY_MODULES = [
+    "stratocaster.strategies.composite",
+    "stratocaster.strategies.connectivity",
+    "stratocaster.strategies.radialgrowth",
+    "stratocaster.strategies.uncertainty",
+]
+
+
+def loaded_modules(statement: str, modules: list[str]) -> list[str]:
+    """Run ``statement`` in a new interpreter and report which of
+    ``modules`` it imported."""
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print(' '.join(name for name in {modules!r} if name in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.split()
+
+
+@pytest.mark.parametrize(
+    "statement", ["import stratocaster", "import stratocaster.strategies"]
+)
+def test_import_is_lazy(statement):
+    assert loaded_modules(statement, HEAVY_MODULES + STRATEGY_MODULES) == []
+
+
+def test_strategy_loaded_on_access():
+    assert loaded_modules(
+        "from stratocaster.strategies import ConnectivityStrategy", STRATEGY_MODULES
+    ) == ["stratocaster.strategies.connectivity"]
+
+
+def test_lazy_attributes():
+    from stratocaster.strategies.radialgrowth import RadialGrowthStrategy
+
+    assert stratocaster.strategies.RadialGrowthStrategy is RadialGrowthStrategy
+    assert set(stratocaster.strategies.__all__) <= set(dir(stratocaster.strategies))
+
+    with pytest.raises(AttributeError, match="NoSuchStrategy"):
+        stratocaster.strategies.NoSuchStrategy
@@ -0,0 +1,85 @@
+import pytest
+from gufe.tests.test_protocol import DummyProtocolResult
+
+from stratocaster.base import KeyedCache, ProposalCache
+from stratocaster.strategies import ConnectivityStrategy
+from stratocaster.strategies.connectivity import ConnectivityStrategySettings
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def strategy():
+    return ConnectivityStrategy(ConnectivityStrategy.default_settings())
+
+
+def test_hits_and_misses(fanning_network, strategy):
+    cache = ProposalCache()
+    first_key, second_key, *_ = (t.key for t in fanning_network.edges)
+
+    proposal = cache.propose(strategy, fanning_network, {first_key: 1})
+    assert proposal == strategy.propose(fanning_network, {first_key: 1})
+
+    # equal counts from a different kind of result hit the cache
+    result = DummyProtocolResult(n_protocol_dag_results=1, info="info")
+    assert cache.propose(strategy, fanning_network, {first_key: result}) is proposal
+
+    # different counts or settings miss
+    cache.propose(strategy, fanning_network, {first_key: 2})
+    cache.propose(strategy, fanning_network, {second_key: 1})
+    other_strategy = ConnectivityStrategy(
+        ConnectivityStrategySettings(max_runs=3, decay_rate=0.25)
+    )
+    cache.propose(other_strategy, fanning_network, {first_key: 1})
+
+    statistics = cache.statistics
+    assert (statistics.hits, statistics.misses) == (1, 4)
+    assert statistics.size == len(cache) == 4
+
+
+def test_results_outside_network_ignored(fanning_network, disconnected_fanning_network):
+    inside_keys = {t.key for t in fanning_network.edges}
+    outside_key = next(
+        t.key for t in disconnected_fanning_network.edges if t.key not in inside_keys
+    )
+
+    assert ProposalCache.fingerprint(
+        fanning_network, {outside_key: 3}
+    ) == ProposalCache.fingerprint(fanning_network, {})
+
+
+def test_maxsize_eviction(fanning_network, strategy):
+    cache = ProposalCache(maxsize=2)
+    keys = [t.key for t in fanning_network.edges]
+
+    for key in keys[:3]:
+        cache.propose(strategy, fanning_network, {key: 1})
+
+    assert len(cache) == 2
+    assert cache.statistics.evictions == 1
+
+
+def test_ttl(fanning_network, strategy):
+    timer = FakeTimer()
+    cache = ProposalCache(ttl=10, timer=timer)
+
+    proposal = cache.propose(strategy, fanning_network, {})
+    timer.now = 5
+    assert cache.propose(strategy, fanning_network, {}) is proposal
+
+    timer.now = 15
+    assert cache.propose(strategy, fanning_network, {}) is not proposal
+
+    statistics = cache.statistics
+    assert (statistics.hits, statistics.misses, statistics.evictions) == (1, 2, 1)
+
+
+def test_keyed_cache_invalid_ttl():
+    with pytest.raises(ValueError):
+        KeyedCache(ttl=0)
@@ -0,0 +1,134 @@
+import networkx as nx
+import numpy as np
+import pytest
+from gufe.tests.test_protocol import DummyProtocolResult
+
+from stratocaster.base.cache import KeyedCache
+from stratocaster.network import NetworkIndex
+from stratocaster.network import index as index_module
+
+
+@pytest.fixture
+def empty_index_cache(monkeypatch):
+    monkeypatch.setattr(index_module, "_index_cache", KeyedCache())
+
+
+def test_index_matches_graph(disconnected_fanning_network, empty_index_cache):
+    graph = disconnected_fanning_network.graph
+    network_index = NetworkIndex.from_network(disconnected_fanning_network)
+
+    assert network_index.n_nodes == graph.number_of_nodes()
+    assert network_index.n_edges == graph.number_of_edges()
+    assert set(network_index.edge_keys) == {
+        transformation.key for transformation in disconnected_fanning_network.edges
+    }
+
+    for transformation in disconnected_fanning_network.edges:
+        position = network_index.edge_keys.position(transformation.key)
+        source = network_index.edge_source[position]
+        target = network_index.edge_target[position]
+        assert network_index.nodes[source] == transformation.stateA
+        assert network_index.nodes[target] == transformation.stateB
+
+    for label, node in enumerate(network_index.nodes):
+        assert network_index.degree[label] == graph.degree(node)
+        neighbors = network_index.indices[
+            network_index.indptr[label] : network_index.indptr[label + 1]
+        ]
+        assert {network_index.nodes[neighbor] for neighbor in neighbors} == set(
+            nx.all_neighbors(graph, node)
+        )
+        assert network_index.adjacency[label] == neighbors.tolist()
+
+    assert network_index.n_components == 2
+    for component in nx.weakly_connected_components(graph):
+        labels = {
+            network_index.component_labels[network_index.nodes.index(node)]
+            for node in component
+        }
+        assert len(labels) == 1
+
+
+def test_index_eccentricity(fanning_network, empty_index_cache):
+    network_index = NetworkIndex.from_network(fanning_network)
+    expected = nx.eccentricity(fanning_network.graph.to_undirected())
+
+    assert network_index.eccentricity is network_index.eccentricity
+    assert {
+        node: eccentricity
+        for node, eccentricity in zip(
+            network_index.nodes, network_index.eccentricity.tolist()
+        )
+    } == expected
+
+
+def test_index_cached(fanning_network, empty_index_cache):
+    assert NetworkIndex.from_network(fanning_network) is NetworkIndex.from_network(
+        fanning_network
+    )
+
+
+def test_index_read_only(fanning_network, empty_index_cache):
+    network_index = NetworkIndex.from_network(fanning_network)
+
+    for array in (
+        network_index.edge_source,
+        network_index.degree,
+        network_index.indices,
+        network_index.component_labels,
+    ):
+        with pytest.raises(ValueError):
+            array[0] = 1
+
+
+def test_index_counts(fanning_network, empty_index_cache):
+    network_index = NetworkIndex.from_network(fanning_network)
+    first, second, *_ = network_index.edge_keys
+
+    counts = network_index.counts(
+        {first: DummyProtocolResult(n_protocol_dag_results=2, info="info"), second: 5}
+    )
+
+    assert counts.dtype == np.int64
+    assert counts[:2].tolist() == [2, 5]
+    assert not counts[2:].any()
+
+
+@pytest.mark.parametrize("eccentricity_first", [False, True])
+def test_index_components(
+    disconnected_fanning_network, empty_index_cache, eccentricity_first
+):
+    network_index = NetworkIndex.from_network(disconnected_fanning_network)
+    if eccentricity_first:
+        network_index.eccentricity
+
+    components = network_index.components
+    assert components is network_index.components
+    assert len(components) == network_index.n_components
+
+    expected = {
+        frozenset(transformation.key for transformation in subgraph.edges)
+        for subgraph in disconnected_fanning_network.connected_subgraphs()
+    }
+    assert {frozenset(component.edge_keys) for component in components} == expected
+
+    for component in components:
+        assert component.n_components == 1
+        assert component.components == (component,)
+
+        parent_labels = [network_index.nodes.index(node) for node in component.nodes]
+        np.testing.assert_array_equal(
+            component.eccentricity, network_index.eccentricity[parent_labels]
+        )
+
+        for key in component.edge_keys:
+            position = component.edge_keys.position(key)
+            parent_position = network_index.edge_keys.position(key)
+            assert (
+                component.nodes[component.edge_source[position]]
+                == network_index.nodes[network_index.edge_source[parent_position]]
+            )
+            assert (
+                component.nodes[component.edge_target[position]]
+                == network_index.nodes[network_index.edge_target[parent_position]]
+            )
@@ -1,9 +1,271 @@
+from random import Random
+
+import networkx as nx
+import pytest
+
+from stratocaster.network import NetworkIndex
 from stratocaster.strategies.radialgrowth import (
     RadialGrowthStrategy,
+    RadialGrowthStrategySettings,
 )
 
+from stratocaster.tests.networks import (
+    digraph_to_alchemical_network,
+    dual_center_fanning_network,
+)
 from stratocaster.tests.utils import StrategyTestMixin
 
 
+@pytest.fixture(scope="module")
+def docstring_network():
+    """The 4-3-2-3-4 network of the RadialGrowthStrategy docstring."""
+    return digraph_to_alchemical_network(
+        nx.DiGraph(
+            [("2", "3a"), ("2", "3b")]
+            + [("3a", f"4a{leaf}") for leaf in range(3)]
+            + [("3b", f"4b{leaf}") for leaf in range(3)]
+        )
+    )
+
+
+def baseline_weights(strategy, alchemical_network, protocol_results, from_center):
+    """Weights of the rule used before the lowest completed distance
+    was independent of the edge order.
+
+    The lowest completed distance starts at the maximum eccentricity,
+    and every Transformation without a result whose upper eccentricity
+    is below it, in the order of the network index, sets it to its
+    lower eccentricity. With ``from_center``, Transformations are
+    visited in order of their lower eccentricity and an upper
+    eccentricity equal to the current value also counts.
+    """
+    settings = strategy.settings
+    weights = {}
+    for component in NetworkIndex.from_network(alchemical_network).components:
+        e = component.eccentricity.tolist()
+        edges = [
+            (key, *sorted((e[state_a], e[state_b])))
+            for key, state_a, state_b in zip(
+                component.edge_keys,
+                component.edge_source.tolist(),
+                component.edge_target.tolist(),
+            )
+        ]
+        if from_center:
+            edges.sort(key=lambda edge: edge[1])
+
+        lowest_complete = max(e)
+        for key, lower, upper in edges:
+            if key not in protocol_results and (
+                upper <= lowest_complete if from_center else upper < lowest_complete
+            ):
+                lowest_complete = lower
+
+        for key, _, upper in edges:
+            weights[key] = strategy._transformation_weight(
+                protocol_results.get(key, 0), upper - lowest_complete
+            )
+    return weights
+
+
 class TestRadialGrowth(StrategyTestMixin):
     strategy_class = RadialGrowthStrategy
+
+    def test_incremental_frontier(self, disconnected_fanning_network):
+        strategy = self.strategy_class(
+            RadialGrowthStrategySettings(max_runs=2, candidacy_max_distance=1)
+        )
+        network_index = NetworkIndex.from_network(disconnected_fanning_network)
+        proposal = strategy.incremental(disconnected_fanning_network, {})
+
+        # add results from the outside in, so the lowest completed
+        # distance only moves once the central tiers are complete
+        counts = {}
+        for component in network_index.components:
+            e = component.eccentricity.tolist()
+            order = sorted(
+                zip(
+                    component.edge_keys,
+                    component.edge_source.tolist(),
+                    component.edge_target.tolist(),
+                ),
+                key=lambda edge: -min(e[edge[1]], e[edge[2]]),
+            )
+            for transformation_key, _, _ in order:
+                counts[transformation_key] = 1
+                weights = proposal.result.weights
+                weights.update(proposal.update_delta({transformation_key: 1}).changed)
+
+                expected = strategy.propose(disconnected_fanning_network, counts)
+                assert weights == expected.weights
+                assert proposal.result.weights == expected.weights
+
+    def test_incremental_shared_result(self, docstring_network):
+        incremental = self.default_strategy.incremental(docstring_network, {})
+        transformation_key = next(
+            transformation.key
+            for transformation in docstring_network.edges
+            if transformation.stateA.name == "2"
+        )
+
+        # the result is only rebuilt once a weight changes
+        previous = incremental.result
+        assert incremental.update({}) is previous
+        assert incremental.update({transformation_key: 0}) is previous
+
+        weights = previous.weights
+        proposal = incremental.update({transformation_key: 1})
+        assert proposal is not previous
+        assert previous.weights == weights
+        assert proposal.weights[transformation_key] != weights[transformation_key]
+
+    def test_docstring_example(self, docstring_network):
+        strategy = self.strategy_class(
+            RadialGrowthStrategySettings(candidacy_max_distance=2)
+        )
+        inner = [
+            transformation.key
+            for transformation in docstring_network.edges
+            if transformation.stateA.name == "2"
+        ]
+        outer = [
+            transformation.key
+            for transformation in docstring_network.edges
+            if transformation.stateA.name != "2"
+        ]
+
+        def outer_weights(protocol_results):
+            weights = strategy.propose(docstring_network, protocol_results).weights
+            return {weights[key] for key in outer}
+
+        # the lowest completed distance is 2 unless both edges of 3-2-3
+        # have results, giving the 3-4 edges an effective distance of 2
+        assert outer_weights({}) == {0.5}
+        assert outer_weights({inner[0]: 1}) == {0.5}
+        assert outer_weights({inner[0]: 0, inner[1]: 2}) == {0.5}
+        assert outer_weights({inner[0]: 1, inner[1]: 2}) == {1.0}
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_lowest_complete_eccentricity(self, seed):
+        rng = Random(seed)
+        graph = nx.connected_watts_strogatz_graph(24, 4, 0.3, seed=seed)
+        network = digraph_to_alchemical_network(nx.DiGraph(graph.edges))
+        eccentricity = nx.eccentricity(graph)
+
+        strategy = self.strategy_class(
+            RadialGrowthStrategySettings(max_runs=4, candidacy_max_distance=3)
+        )
+        counts = {
+            transformation.key: rng.choice([0, 0, 1, 2])
+            for transformation in network.edges
+        }
+
+        # the lowest completed distance is independent of the order of
+        # the Transformations
+        tiers = {
+            transformation.key: sorted(
+                eccentricity[state.name]
+                for state in (transformation.stateA, transformation.stateB)
+            )
+            for transformation in network.edges
+        }
+        lowest_complete = min(
+            (lower for key, (lower, _) in tiers.items() if counts[key] == 0),
+            default=max(eccentricity.values()),
+        )
+
+        assert strategy.propose(network, counts).weights == {
+            key: strategy._transformation_weight(counts[key], upper - lowest_complete)
+            for key, (_, upper) in tiers.items()
+        }
+
+    @pytest.mark.parametrize(
+        "network",
+        [
+            "fanning_network",
+            "disconnected_fanning_network",
+            "dual_center_fanning_network",
+            "benzene_variants_star_map",
+        ],
+    )
+    def test_baseline_rule(self, network, request):
+        if network == "dual_center_fanning_network":
+            network = dual_center_fanning_network()
+        else:
+            network = request.getfixturevalue(network)
+
+        strategy = self.default_strategy
+        tiers = {}
+        for component in NetworkIndex.from_network(network).components:
+            e = component.eccentricity.tolist()
+            for key, state_a, state_b in zip(
+                component.edge_keys,
+                component.edge_source.tolist(),
+                component.edge_target.tolist(),
+            ):
+                edge = e[state_a], e[state_b]
+                tiers.setdefault(min(edge), []).append((key, max(edge) == max(e)))
+
+        rng = Random(0)
+        for tier, edges in sorted(tiers.items()):
+            # a result for every Transformation but half of one tier
+            missing = rng.sample(edges, max(1, len(edges) // 2))
+            protocol_results = {
+                transformation.key: 1 for transformation in network.edges
+            }
+            for key, _ in missing:
+                del protocol_results[key]
+
+            weights = strategy.propose(network, protocol_results).weights
+            assert weights == baseline_weights(
+                strategy, network, protocol_results, from_center=True
+            )
+
+            # the previous rule agrees unless the missing Transformations
+            # reach the outermost tier, which it never considered complete
+            if not any(outermost for _, outermost in missing):
+                assert weights == baseline_weights(
+                    strategy, network, protocol_results, from_center=False
+                )
+
+            # a count of zero is the same as a missing result
+            assert (
+                strategy.propose(
+                    network, protocol_results | {key: 0 for key, _ in missing}
+                ).weights
+                == weights
+            )
+
+        # without any results, the previous rule depended on the order
+        # of the Transformations, the new one visits them from the center
+        assert strategy.propose(network, {}).weights == baseline_weights(
+            strategy, network, {}, from_center=True
+        )
+
+
+class TestApproximateRadialGrowth(StrategyTestMixin):
+    strategy_class = RadialGrowthStrategy
+    _default_settings = RadialGrowthStrategySettings(
+        eccentricity_mode="approximate", eccentricity_sweeps=2
+    )
+
+    def test_matches_exact(self, disconnected_fanning_network):
+        exact = RadialGrowthStrategy(RadialGrowthStrategySettings())
+        approximate = RadialGrowthStrategy(
+            RadialGrowthStrategySettings(
+                eccentricity_mode="approximate", eccentricity_sweeps=100
+            )
+        )
+
+        # with enough sweeps, every eccentricity is exact
+        assert (
+            approximate.propose(disconnected_fanning_network, {}).weights
+            == exact.propose(disconnected_fanning_network, {}).weights
+        )
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError, match="eccentricity_sweeps"):
+            RadialGrowthStrategySettings(eccentricity_sweeps=0)
+
+        with pytest.raises(ValueError, match="eccentricity_tolerance"):
+            RadialGrowthStrategySettings(eccentricity_tolerance=-1)
@@ -0,0 +1,110 @@
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from stratocaster import registry
+from stratocaster.registry import (
+    available_strategies,
+    get_strategy_class,
+    strategy_from_config,
+)
+from stratocaster.strategies import (
+    CompositeStrategy,
+    ConnectivityStrategy,
+    RadialGrowthStrategy,
+)
+from stratocaster.strategies.connectivity import ConnectivityStrategySettings
+
+from stratocaster.tests.test_imports import loaded_modules
+
+
+@pytest.fixture
+def plugin_entry_points(monkeypatch):
+    """Replace the discovered entry points with plugins that cannot
+    be imported."""
+    entry_points = {
+        "connectivity": EntryPoint(
+            "connectivity",
+            "stratocaster.strategies.connectivity:ConnectivityStrategy",
+            registry.ENTRY_POINT_GROUP,
+        ),
+        "missing": EntryPoint(
+            "missing", "no_such_plugin:MissingStrategy", registry.ENTRY_POINT_GROUP
+        ),
+        "not_a_strategy": EntryPoint(
+            "not_a_strategy",
+            "stratocaster.registry:ENTRY_POINT_GROUP",
+            registry.ENTRY_POINT_GROUP,
+        ),
+    }
+    monkeypatch.setattr(registry, "_strategy_entry_points", lambda: entry_points)
+    get_strategy_class.cache_clear()
+    yield
+    get_strategy_class.cache_clear()
+
+
+def test_builtin_strategies():
+    assert {"composite", "connectivity", "radialgrowth"} <= set(available_strategies())
+    assert get_strategy_class("connectivity") is ConnectivityStrategy
+    assert get_strategy_class("radialgrowth") is RadialGrowthStrategy
+    assert get_strategy_class("composite") is CompositeStrategy
+
+
+def test_lookup_is_lazy():
+    assert loaded_modules(
+        "from stratocaster.registry import available_strategies, get_strategy_class\n"
+        "available_strategies()\n"
+        "get_strategy_class('radialgrowth')",
+        [
+            "stratocaster.strategies.composite",
+            "stratocaster.strategies.connectivity",
+            "stratocaster.strategies.radialgrowth",
+        ],
+    ) == ["stratocaster.strategies.radialgrowth"]
+
+
+def test_unused_plugins_not_loaded(plugin_entry_points):
+    assert available_strategies() == ["connectivity", "missing", "not_a_strategy"]
+    assert get_strategy_class("connectivity") is ConnectivityStrategy
+
+    with pytest.raises(ModuleNotFoundError):
+        get_strategy_class("missing")
+
+    with pytest.raises(TypeError, match="not a Strategy subclass"):
+        get_strategy_class("not_a_strategy")
+
+    with pytest.raises(ValueError, match="Unknown strategy 'radialgrowth'"):
+        get_strategy_class("radialgrowth")
+
+
+def test_strategy_from_config():
+    strategy = strategy_from_config(
+        {"strategy": "connectivity", "settings": {"max_runs": 5, "cutoff": None}}
+    )
+    assert strategy == ConnectivityStrategy(
+        ConnectivityStrategySettings(max_runs=5, cutoff=None)
+    )
+
+    assert strategy_from_config({"strategy": "radialgrowth"}) == RadialGrowthStrategy(
+        RadialGrowthStrategy.default_settings()
+    )
+
+    composite = strategy_from_config(
+        {
+            "strategy": "composite",
+            "settings": {"blend": "product"},
+            "strategies": [
+                {"strategy": "connectivity", "settings": {"max_runs": 5}},
+                {"strategy": "radialgrowth"},
+            ],
+        }
+    )
+    assert isinstance(composite, CompositeStrategy)
+    assert composite.settings.blend == "product"
+    assert [type(child) for child in composite.strategies] == [
+        ConnectivityStrategy,
+        RadialGrowthStrategy,
+    ]
+
+    with pytest.raises(ValueError, match="must have a `strategy` name"):
+        strategy_from_config({"settings": {}})
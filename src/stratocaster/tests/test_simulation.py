@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from stratocaster.simulation import SimulationResult, simulate
+from stratocaster.strategies import ConnectivityStrategy, RadialGrowthStrategy
+from stratocaster.strategies.connectivity import ConnectivityStrategySettings
+
+
+@pytest.fixture
+def strategy():
+    return ConnectivityStrategy(ConnectivityStrategySettings(max_runs=3))
+
+
+@pytest.mark.parametrize("policy", ["weighted", "top_k", "uniform"])
+def test_simulate_terminates(fanning_network, strategy, policy):
+
+    result = simulate(strategy, fanning_network, policy=policy, batch_size=5, seed=0)
+
+    assert isinstance(result, SimulationResult)
+    assert result.terminated
+    assert result.total_runs == result.counts.sum()
+    assert (result.counts >= 3).all()
+    assert result.weights.shape == (result.n_iterations + 1, len(result.key_table))
+
+    # the final proposal has no remaining work
+    assert not (result.weights[-1] > 0).any()
+
+
+def test_simulate_matches_propose(fanning_network, strategy):
+
+    result = simulate(strategy, fanning_network, batch_size=3, seed=1)
+
+    # replay the recorded counts through the full proposal
+    counts = dict(zip(result.key_table, result.counts.tolist()))
+    final = strategy.propose(fanning_network, counts).to_array(result.key_table)
+
+    np.testing.assert_array_equal(final.weights, result.weights[-1])
+
+
+def test_simulate_seeded(fanning_network, strategy):
+
+    first = simulate(strategy, fanning_network, seed=42)
+    second = simulate(strategy, fanning_network, seed=42)
+
+    np.testing.assert_array_equal(first.weights, second.weights)
+    np.testing.assert_array_equal(first.counts, second.counts)
+
+
+def test_simulate_max_iterations(fanning_network, strategy):
+
+    result = simulate(
+        strategy, fanning_network, max_iterations=10, seed=0, record_weights=False
+    )
+
+    assert not result.terminated
+    assert result.n_iterations == 10
+    assert result.total_runs == 10
+    assert result.weights.shape == (0, len(result.key_table))
+
+
+def test_simulate_initial_counts(fanning_network, strategy):
+
+    initial_counts = {transformation.key: 3 for transformation in fanning_network.edges}
+    result = simulate(strategy, fanning_network, initial_counts=initial_counts)
+
+    assert result.terminated
+    assert result.n_iterations == 0
+    assert result.total_runs == 0
+
+
+def test_simulate_custom_policy(fanning_network):
+
+    strategy = RadialGrowthStrategy(RadialGrowthStrategy._default_settings())
+
+    def first_positive(proposal, batch_size, rng):
+        (positions,) = np.nonzero(proposal.weights > 0)
+        return [proposal.key_table[position] for position in positions[:batch_size]]
+
+    result = simulate(strategy, fanning_network, policy=first_positive, batch_size=2)
+
+    assert result.terminated
+    assert result.total_runs == result.counts.sum()
+
+
+def test_simulate_invalid(fanning_network, strategy):
+
+    with pytest.raises(ValueError, match="Unknown policy"):
+        simulate(strategy, fanning_network, policy="greedy")
+
+    with pytest.raises(ValueError, match="batch_size"):
+        simulate(strategy, fanning_network, batch_size=0)
@@ -1,7 +1,20 @@
+from numbers import Integral
+
+import numpy as np
+import pytest
 from gufe import AlchemicalNetwork, ProtocolResult
+from gufe.tests.test_protocol import DummyProtocolResult
 from gufe.tokenization import GufeKey
 
-from stratocaster.base import Strategy, StrategyResult, StrategySettings
+from stratocaster.base import (
+    ResultSummary,
+    Strategy,
+    StrategyResult,
+    StrategyResultDelta,
+    StrategySettings,
+    result_count,
+)
+from stratocaster.strategies import ConnectivityStrategy, RadialGrowthStrategy
 
 
 class TestStrategyResult:
@@ -28,6 +41,137 @@ class TestStrategyResult:
         res = self.result.resolve()
         assert 1 == sum([value for _, value in res.items() if value is not None])
 
+    def test_top_k(self):
+        assert self.result.top_k(1) == [(GufeKey("MyOtherTransformation-789xyz"), 10)]
+        assert self.result.top_k(5) == [
+            (GufeKey("MyOtherTransformation-789xyz"), 10),
+            (GufeKey("MyTransformation-ABC123"), 1),
+        ]
+        assert self.result.top_k(0) == []
+
+    def test_top_k_ties(self):
+        weights = {GufeKey(f"MyTransformation-{i}"): float(i % 3) for i in range(30)}
+        weights[GufeKey("MyTransformation-None")] = None
+        result = StrategyResult(weights)
+
+        for k in (0, 1, 5, 10, 12, 29, 40):
+            expected = sorted(
+                [
+                    (key, weight)
+                    for key, weight in weights.items()
+                    if weight is not None
+                ],
+                key=lambda item: -item[1],
+            )[:k]
+            assert result.top_k(k) == expected
+            assert result.to_array().top_k(k) == expected
+
+    def test_iter_descending(self):
+        weights = {GufeKey(f"MyTransformation-{i}"): float(i % 7) for i in range(20)}
+        weights[GufeKey("MyTransformation-None")] = None
+        result = StrategyResult(weights)
+
+        expected = sorted(
+            [(key, weight) for key, weight in weights.items() if weight is not None],
+            key=lambda item: -item[1],
+        )
+        assert list(result.iter_descending()) == expected
+
+    def test_sample_with_replacement(self):
+        samples = self.result.sample(1100, seed=0)
+
+        # None weights are never sampled
+        assert set(samples) <= {
+            GufeKey("MyTransformation-ABC123"),
+            GufeKey("MyOtherTransformation-789xyz"),
+        }
+        # with weights 1 and 10, roughly 100 of the samples are
+        # expected to be MyTransformation-ABC123
+        assert 50 < samples.count(GufeKey("MyTransformation-ABC123")) < 150
+
+    def test_sample_without_replacement(self):
+        samples = self.result.sample(2, replace=False, seed=0)
+        assert sorted(samples) == sorted(
+            [
+                GufeKey("MyTransformation-ABC123"),
+                GufeKey("MyOtherTransformation-789xyz"),
+            ]
+        )
+
+        with pytest.raises(ValueError):
+            self.result.sample(3, replace=False)
+
+    def test_sample_deterministic(self):
+        assert self.result.sample(20, seed=42) == self.result.sample(20, seed=42)
+        assert self.result.sample(2, replace=False, seed=42) == self.result.sample(
+            2, replace=False, seed=42
+        )
+
+    def test_sample_no_positive_weights(self):
+        result = StrategyResult({GufeKey("MyTransformation-ABC123"): 0.0})
+
+        assert result.sample(0) == []
+        with pytest.raises(ValueError):
+            result.sample(1)
+
+    def test_delta(self):
+        current = StrategyResult(
+            {
+                # unchanged
+                GufeKey("MyTransformation-ABC123"): 1,
+                # None to a weight
+                GufeKey("MyTransformation-321CBA"): 3,
+                # appeared
+                GufeKey("MyTransformation-DEF456"): None,
+            }
+        )
+
+        delta = current.delta(self.result)
+
+        assert delta.changed == {
+            GufeKey("MyTransformation-321CBA"): 3,
+            GufeKey("MyTransformation-DEF456"): None,
+        }
+        assert delta.removed == {GufeKey("MyOtherTransformation-789xyz")}
+        assert len(delta) == 3
+        assert delta.apply(self.result) == current
+
+    def test_delta_became_none(self):
+        current = StrategyResult(
+            self.result.weights | {GufeKey("MyOtherTransformation-789xyz"): None}
+        )
+
+        delta = current.delta(self.result)
+
+        assert delta.changed == {GufeKey("MyOtherTransformation-789xyz"): None}
+        assert not delta.removed
+        assert len(self.result.delta(self.result)) == 0
+
+    def test_delta_dict_roundtrip(self):
+        delta = StrategyResult({}).delta(self.result)
+        assert StrategyResultDelta.from_dict(delta.to_dict()) == delta
+
+    def test_merge(self):
+        other = StrategyResult({GufeKey("MyTransformation-DEF456"): 2})
+        empty = StrategyResult({})
+
+        merged = StrategyResult.merge([self.result, empty, other])
+
+        assert merged == self.result | empty | other
+        assert merged.weights == self.result.weights | other.weights
+
+    def test_merge_empty(self):
+        assert StrategyResult.merge([]) == StrategyResult({})
+
+    def test_merge_overlapping_keys(self):
+        overlapping = StrategyResult({GufeKey("MyTransformation-ABC123"): 2})
+
+        with pytest.raises(ValueError):
+            StrategyResult.merge([self.result, overlapping])
+
+        with pytest.raises(ValueError):
+            self.result | overlapping
+
 
 class DummyStrategySettings(StrategySettings):
     pass
@@ -57,3 +201,90 @@ class TestStrategy:
     def test_dict_roundtrip(self):
         strategy_dict_form = self.strategy.to_dict()
         assert DummyStrategy.from_dict(strategy_dict_form) == self.strategy
+
+
+@pytest.mark.parametrize(
+    ("result", "count"),
+    [
+        (None, 0),
+        (4, 4),
+        (np.int64(3), 3),
+        (np.uint8(5), 5),
+        (DummyProtocolResult(n_protocol_dag_results=2, info="info"), 2),
+    ],
+)
+def test_result_count(result, count):
+    assert isinstance(result, (type(None), Integral, ResultSummary))
+    assert result_count(result) == count
+    assert type(result_count(result)) is int
+
+
+def test_result_count_bool():
+    with pytest.raises(TypeError, match="not a bool"):
+        result_count(True)
+
+
+def test_propose_numpy_counts(fanning_network):
+
+    strategy = ConnectivityStrategy(ConnectivityStrategy._default_settings())
+    counts = {transformation.key: 2 for transformation in fanning_network.edges}
+
+    # counts read from an array are NumPy integers
+    numpy_counts = dict(zip(counts, np.full(len(counts), 2, dtype=np.int64)))
+    assert strategy.propose(fanning_network, numpy_counts) == strategy.propose(
+        fanning_network, counts
+    )
+
+
+def test_propose_batch_owned_pool(fanning_network):
+
+    strategy = ConnectivityStrategy(ConnectivityStrategy._default_settings())
+    items = [(fanning_network, {}), (fanning_network, {})]
+
+    proposals = dict(strategy.propose_batch(items, max_workers=1))
+
+    assert proposals[0] == proposals[1] == strategy.propose(fanning_network, {})
+
+    with pytest.raises(ValueError, match="chunksize"):
+        next(strategy.propose_batch(items, chunksize=0))
+
+
+def test_propose_cached_components(disconnected_fanning_network, monkeypatch):
+
+    strategy = ConnectivityStrategy(ConnectivityStrategy._default_settings())
+    expected = strategy.propose(disconnected_fanning_network, {})
+
+    def connected_subgraphs(self):
+        raise AssertionError("connected_subgraphs should not be called")
+
+    # strategies implementing _propose_index use the cached components
+    monkeypatch.setattr(AlchemicalNetwork, "connected_subgraphs", connected_subgraphs)
+    assert strategy.propose(disconnected_fanning_network, {}) == expected
+
+
+@pytest.mark.parametrize("strategy_class", [ConnectivityStrategy, RadialGrowthStrategy])
+def test_versioned_proposal(fanning_network, strategy_class):
+
+    strategy = strategy_class(strategy_class._default_settings())
+    keys = sorted(transformation.key for transformation in fanning_network.edges)
+
+    incremental = strategy.incremental(fanning_network, {})
+    weights = incremental._weights
+
+    counts = {}
+    results = []
+    expected = []
+    for position, key in enumerate(keys[:6]):
+        counts[key] = position % 3 + 1
+        results.append(incremental.update({key: counts[key]}))
+        expected.append(strategy.propose(fanning_network, counts))
+
+    # the weights are changed in place, while results that were not
+    # used yet still reflect the version they were published at
+    assert incremental._weights is weights
+    assert incremental._log
+    assert results == expected
+
+    # changes are no longer logged once every result was used
+    assert incremental.update_delta({keys[0]: 3}).changed == {keys[0]: None}
+    assert not incremental._log
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from stratocaster.base import ProposeTracer
+from stratocaster.base.tracing import current_tracer, phase
+from stratocaster.strategies import ConnectivityStrategy, RadialGrowthStrategy
+
+
+def test_no_tracer():
+    assert current_tracer() is None
+
+    # phases are ignored without an active proposal
+    with phase("anything"):
+        pass
+
+
+def test_propose_record(disconnected_fanning_network):
+    strategy = ConnectivityStrategy(ConnectivityStrategy.default_settings())
+
+    with ProposeTracer() as tracer:
+        assert current_tracer() is tracer
+        proposal = strategy.propose(disconnected_fanning_network, {})
+
+    assert current_tracer() is None
+    assert proposal == strategy.propose(disconnected_fanning_network, {})
+
+    (record,) = tracer.records
+    assert record.strategy == "ConnectivityStrategy"
+    assert record.network_key == disconnected_fanning_network.key
+    assert set(record.phases) == {"components", "propose", "merge"}
+    assert record.wall_time >= sum(record.phases.values())
+    assert record.n_components == 2
+    assert record.n_edges == len(disconnected_fanning_network.edges)
+    assert record.n_weights == len(proposal.weights)
+
+
+def test_strategy_phases(fanning_network):
+    strategy = RadialGrowthStrategy(RadialGrowthStrategy.default_settings())
+
+    with ProposeTracer() as tracer:
+        strategy.propose(fanning_network, {})
+
+    (record,) = tracer.records
+    assert "eccentricity" in record.phases
+    assert record.phases["eccentricity"] <= record.phases["propose"]
+
+
+def test_callback_and_executor(disconnected_fanning_network):
+    strategy = ConnectivityStrategy(ConnectivityStrategy.default_settings())
+    received = []
+
+    with ProposeTracer(callback=received.append) as tracer:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            strategy.propose(disconnected_fanning_network, {}, executor=executor)
+        strategy.propose(disconnected_fanning_network, {})
+
+    assert received == tracer.records
+    assert len(received) == 2
+    assert received[0].n_components == received[1].n_components == 2
@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+from random import Random
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from stratocaster.base.cache import KeyedCache
+from stratocaster.simulation import simulate
+from stratocaster.network import NetworkIndex
+from stratocaster.strategies import UncertaintyStrategy
+from stratocaster.strategies import uncertainty as uncertainty_module
+from stratocaster.strategies.uncertainty import UncertaintyStrategySettings
+
+from stratocaster.tests.utils import StrategyTestMixin
+
+
+@dataclass(frozen=True)
+class UncertainSummary:
+    """A ``ResultSummary`` that also reports an uncertainty."""
+
+    n_protocol_dag_results: int
+    uncertainty: float
+
+    def get_uncertainty(self) -> float:
+        return self.uncertainty
+
+
+@pytest.fixture
+def empty_laplacian_cache(monkeypatch):
+    monkeypatch.setattr(uncertainty_module, "_laplacian_cache", KeyedCache())
+
+
+def random_results(network, seed):
+    rng = Random(seed)
+    results = {}
+    for transformation in network.edges:
+        count = rng.randint(0, 3)
+        if count:
+            results[transformation.key] = UncertainSummary(
+                n_protocol_dag_results=count, uncertainty=rng.uniform(0.2, 2.0)
+            )
+    return results
+
+
+def dense_variance_reductions(network, protocol_results, settings):
+    """Reference weights from dense pseudo-inverses of the Laplacian."""
+    network_index = NetworkIndex.from_network(network)
+
+    weights = []
+    increments = []
+    for key in network_index.edge_keys:
+        result = protocol_results.get(key)
+        count = 0 if result is None else result.n_protocol_dag_results
+        run_variance = (
+            count * result.uncertainty**2 if count else settings.default_uncertainty**2
+        )
+        weights.append(1 / settings.prior_uncertainty**2 + count / run_variance)
+        increments.append(1 / run_variance)
+
+    incidence = np.zeros((network_index.n_edges, network_index.n_nodes))
+    edges = np.arange(network_index.n_edges)
+    incidence[edges, network_index.edge_source] = 1
+    incidence[edges, network_index.edge_target] = -1
+
+    covariance = np.linalg.pinv(incidence.T @ np.diag(weights) @ incidence)
+
+    reductions = {}
+    for edge, key in enumerate(network_index.edge_keys):
+        # the Sherman-Morrison reduction of the trace of the covariance
+        projected = covariance @ incidence[edge]
+        reductions[key] = (
+            increments[edge]
+            * (projected @ projected)
+            / (1 + increments[edge] * (incidence[edge] @ projected))
+        )
+    return reductions
+
+
+class TestUncertaintyStrategy(StrategyTestMixin):
+
+    strategy_class = UncertaintyStrategy
+    valid_settings = [
+        UncertaintyStrategySettings(max_runs=mr, cutoff=co, max_update_rank=rank)
+        for mr, co, rank in [(3, None, 32), (10, 0.05, 0), (5, 0.01, 4)]
+    ]
+
+    @pytest.mark.parametrize("settings", valid_settings)
+    def test_simulated_termination(self, fanning_network, settings):
+
+        StrategyTestMixin.test_simulated_termination(
+            self, fanning_network, settings=settings
+        )
+
+    def test_reproducible(self, fanning_network, monkeypatch):
+
+        strategy = self.default_strategy
+        protocol_results = random_results(fanning_network, 0)
+
+        monkeypatch.setattr(uncertainty_module, "_laplacian_cache", KeyedCache())
+        expected = strategy.propose(fanning_network, protocol_results)
+
+        # a proposal does not depend on the factorization cached by an
+        # earlier proposal with a few different results
+        monkeypatch.setattr(uncertainty_module, "_laplacian_cache", KeyedCache())
+        nearby_results = dict(protocol_results)
+        for transformation in list(fanning_network.edges)[:2]:
+            nearby_results[transformation.key] = UncertainSummary(
+                n_protocol_dag_results=4, uncertainty=0.1
+            )
+        strategy.propose(fanning_network, nearby_results)
+
+        assert strategy.propose(fanning_network, protocol_results) == expected
+
+    def test_cutoff_termination(self, fanning_network):
+
+        strategy = UncertaintyStrategy(
+            UncertaintyStrategySettings(max_runs=None, cutoff=0.05)
+        )
+        result = simulate(
+            strategy, fanning_network, policy="uniform", batch_size=5, seed=0
+        )
+
+        assert result.terminated
+        assert not (result.weights[-1] > 0).any()
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_matches_dense(self, disconnected_fanning_network, seed):
+
+        settings = UncertaintyStrategySettings(max_runs=10)
+        strategy = UncertaintyStrategy(settings)
+        protocol_results = random_results(disconnected_fanning_network, seed)
+
+        proposal = strategy.propose(disconnected_fanning_network, protocol_results)
+
+        # components are independent, so the dense reference is computed
+        # over the whole network at once
+        expected = dense_variance_reductions(
+            disconnected_fanning_network, protocol_results, settings
+        )
+        assert proposal.weights.keys() == expected.keys()
+        for key, weight in proposal.weights.items():
+            assert weight == pytest.approx(expected[key], rel=1e-6)
+
+    def test_counts_use_default_uncertainty(self, fanning_network):
+
+        settings = UncertaintyStrategySettings(max_runs=10, default_uncertainty=0.5)
+        strategy = UncertaintyStrategy(settings)
+
+        counts = {
+            transformation.key: n % 3
+            for n, transformation in enumerate(fanning_network.edges)
+        }
+        summaries = {
+            key: UncertainSummary(
+                n_protocol_dag_results=count, uncertainty=0.5 / count**0.5
+            )
+            for key, count in counts.items()
+            if count
+        }
+
+        from_counts = strategy.propose(fanning_network, counts)
+        from_summaries = strategy.propose(fanning_network, summaries)
+        for key, weight in from_counts.weights.items():
+            assert weight == pytest.approx(from_summaries.weights[key])
+
+    @pytest.mark.parametrize("max_update_rank", [0, 4, 1000])
+    def test_factorization_reuse(
+        self, fanning_network, empty_laplacian_cache, max_update_rank
+    ):
+
+        settings = UncertaintyStrategySettings(
+            max_runs=10, max_update_rank=max_update_rank
+        )
+        strategy = UncertaintyStrategy(settings)
+        protocol_results = random_results(fanning_network, 0)
+        strategy.propose(fanning_network, protocol_results)
+
+        (laplacian,) = [
+            value for value, _ in uncertainty_module._laplacian_cache._data.values()
+        ]
+        assert laplacian.n_factorizations == 1
+
+        # change a few Transformations at a time
+        keys = [transformation.key for transformation in fanning_network.edges]
+        for step in range(3):
+            for key in keys[4 * step : 4 * step + 2]:
+                protocol_results[key] = UncertainSummary(
+                    n_protocol_dag_results=4, uncertainty=0.1 * (step + 1)
+                )
+
+            proposal = strategy.propose(fanning_network, protocol_results)
+            expected = dense_variance_reductions(
+                fanning_network, protocol_results, settings
+            )
+            for key, weight in proposal.weights.items():
+                assert weight == pytest.approx(expected[key], rel=1e-6)
+
+        # two, four and six changed weights against the factorized ones
+        match max_update_rank:
+            case 0:
+                assert laplacian.n_factorizations == 4
+            case 4:
+                assert laplacian.n_factorizations == 2
+            case 1000:
+                assert laplacian.n_factorizations == 1
+
+    def test_invalid_settings(self):
+
+        with pytest.raises(ValueError, match="uncertainties must be greater than 0"):
+            UncertaintyStrategySettings(max_runs=3, prior_uncertainty=0)
+
+        with pytest.raises(ValueError, match="At least one of"):
+            UncertaintyStrategySettings(max_runs=None, cutoff=None)
+
+    def test_missing_scipy(self, monkeypatch):
+
+        monkeypatch.setattr(uncertainty_module, "find_spec", lambda name: None)
+        with pytest.raises(ImportError, match="`uncertainty` extra"):
+            UncertaintyStrategy(self.default_settings)
@@ -1,12 +1,22 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from random import randint, shuffle
 
 import pytest
 
 from gufe.tests.test_protocol import DummyProtocolResult
 
+from stratocaster.base.counts import result_counts
 from stratocaster.base.strategy import StrategyResult
 
 
+@dataclass(frozen=True)
+class CountSummary:
+    """A minimal ``ResultSummary`` holding only a result count."""
+
+    n_protocol_dag_results: int
+
+
 class StrategyTestMixin:
     r"""A mixin base class for testing strategies.
 
@@ -79,6 +89,84 @@ class StrategyTestMixin:
         strategy = self.strategy_or_default(settings)
         strategy.propose(disconnected_fanning_network, {})
 
+    def test_propose_override(self, disconnected_fanning_network, settings=None):
+        strategy = self.strategy_or_default(settings)
+
+        class OverriddenStrategy(type(strategy)):
+            def _propose(self, alchemical_network, protocol_results):
+                return StrategyResult(
+                    {
+                        transformation.key: 0.25
+                        for transformation in alchemical_network.edges
+                    }
+                )
+
+        # subclasses overriding _propose are proposed with the override
+        overridden = OverriddenStrategy._from_dict(strategy._to_dict())
+        assert overridden.propose(disconnected_fanning_network, {}) == StrategyResult(
+            {
+                transformation.key: 0.25
+                for transformation in disconnected_fanning_network.edges
+            }
+        )
+
+    @pytest.mark.parametrize(
+        "executor_class", [ThreadPoolExecutor, ProcessPoolExecutor]
+    )
+    def test_propose_executor(
+        self, disconnected_fanning_network, executor_class, settings=None
+    ):
+        strategy = self.strategy_or_default(settings)
+
+        protocol_results = {
+            transformation.key: DummyProtocolResult(
+                n_protocol_dag_results=randint(0, 3),
+                info=f"key: {transformation.key}",
+            )
+            for transformation in disconnected_fanning_network.edges
+        }
+
+        with executor_class(max_workers=2) as executor:
+            proposal = strategy.propose(
+                disconnected_fanning_network, protocol_results, executor=executor
+            )
+
+        assert proposal == strategy.propose(
+            disconnected_fanning_network, protocol_results
+        )
+
+    @pytest.mark.parametrize("chunksize", [1, 2])
+    def test_propose_batch(
+        self,
+        fanning_network,
+        disconnected_fanning_network,
+        chunksize,
+        settings=None,
+    ):
+        strategy = self.strategy_or_default(settings)
+
+        networks = [fanning_network, disconnected_fanning_network] * 2
+        items = [
+            (
+                network,
+                {transformation.key: randint(0, 3) for transformation in network.edges},
+            )
+            for network in networks
+        ]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            proposals = dict(
+                strategy.propose_batch(items, chunksize=chunksize, executor=executor)
+            )
+
+        assert sorted(proposals) == list(range(len(items)))
+        for index, (network, protocol_results) in enumerate(items):
+            assert proposals[index] == strategy.propose(network, protocol_results)
+
+        # invalid arguments are rejected before iterating
+        with pytest.raises(ValueError, match="chunksize"):
+            strategy.propose_batch(items, chunksize=0)
+
     def test_simulated_termination(self, fanning_network, settings=None):
 
         strategy = self.strategy_or_default(settings)
@@ -131,3 +219,39 @@ class StrategyTestMixin:
             else:
                 break
             current_iteration += 1
+
+    def test_incremental(self, disconnected_fanning_network, settings=None):
+
+        strategy = self.strategy_or_default(settings)
+
+        transformation_keys = [
+            transformation.key for transformation in disconnected_fanning_network.edges
+        ]
+        protocol_results = {}
+
+        incremental = strategy.incremental(disconnected_fanning_network, {})
+        assert incremental.result == strategy.propose(disconnected_fanning_network, {})
+
+        for _ in range(10):
+            shuffle(transformation_keys)
+            changed = {
+                transformation_key: DummyProtocolResult(
+                    n_protocol_dag_results=randint(0, 3),
+                    info=f"key: {transformation_key}",
+                )
+                for transformation_key in transformation_keys[:3]
+            }
+            protocol_results |= changed
+
+            previous = incremental.result
+            delta = incremental.update_delta(changed)
+            proposal = incremental.result
+            assert proposal == strategy.propose(
+                disconnected_fanning_network, protocol_results
+            )
+            # compare numerically, a delta omits weights that only
+            # changed between equal int and float values
+            assert delta.apply(previous).weights == proposal.weights
+            assert delta.changed == proposal.delta(previous).changed
+
+            assert incremental.update({}) == proposal